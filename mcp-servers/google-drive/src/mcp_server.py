@@ -19,6 +19,7 @@ Tools:
 - update_file: Update file content
 - delete_file: Delete a file (trash or permanent)
 - move_file: Move file to a different folder
+- move_files: Move several files concurrently
 - copy_file: Copy a file
 - share_file: Share a file with users
 - get_file_permissions: Get file sharing permissions
@@ -37,9 +38,18 @@ import urllib.parse
 import urllib.error
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 import socket
 import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: orjson serializes responses faster and straight to bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Google Drive API endpoints
 DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
@@ -60,6 +70,18 @@ GOOGLE_MIME_TYPES = {
     "application/vnd.google-apps.drawing": {"export": "image/png", "extension": ".png"},
 }
 
+# Content above this size is sent with a resumable upload in chunks
+# (chunk size must be a multiple of 256 KB)
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+RESUMABLE_CHUNK_SIZE = 32 * 256 * 1024
+
+# Partial-response field selectors, built once rather than per request
+LIST_FIELDS = "files(id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink,webContentLink,owners,shared,starred,trashed,driveId)"
+GET_FIELDS = "id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink,webContentLink,owners,shared,starred,trashed,description,driveId"
+SEARCH_FIELDS = "files(id,name,mimeType,size,modifiedTime,webViewLink,owners,driveId)"
+READ_META_FIELDS = "id,name,mimeType,size"
+PERMISSION_FIELDS = "permissions(id,type,role,emailAddress,displayName)"
+
 # Default paths
 DEFAULT_CREDENTIALS_PATH = Path(__file__).parent.parent.parent / "google-calendar" / "gcp-oauth.keys.json"
 DEFAULT_TOKEN_PATH = Path(__file__).parent.parent / "tokens.json"
@@ -73,6 +95,7 @@ class OAuthHandler:
         self.token_path = token_path
         self.credentials = self._load_credentials()
         self.token = self._load_token()
+        self._lock = threading.Lock()
     
     def _load_credentials(self) -> Dict[str, Any]:
         """Load OAuth credentials from file."""
@@ -252,43 +275,70 @@ class OAuthHandler:
         return True
     
     def get_access_token(self) -> str:
-        """Get a valid access token."""
-        if self._is_token_expired():
-            if not self._refresh_token():
+        """Get a valid access token (safe to call from worker threads)."""
+        with self._lock:
+            if self._is_token_expired():
+                if not self._refresh_token():
+                    self.authorize()
+            
+            if not self.token or "access_token" not in self.token:
                 self.authorize()
-        
-        if not self.token or "access_token" not in self.token:
-            self.authorize()
-        
-        return self.token["access_token"]
+            
+            return self.token["access_token"]
 
 
 _oauth_handler: Optional[OAuthHandler] = None
 
 
+_oauth_handler_lock = threading.Lock()
+
+
 def _get_oauth_handler() -> OAuthHandler:
     """Get or create the OAuth handler."""
     global _oauth_handler
     
-    if _oauth_handler is None:
-        creds_path = Path(os.environ.get("GOOGLE_OAUTH_CREDENTIALS", DEFAULT_CREDENTIALS_PATH))
-        token_path = Path(os.environ.get("GOOGLE_DRIVE_TOKEN_PATH", DEFAULT_TOKEN_PATH))
-        _oauth_handler = OAuthHandler(creds_path, token_path)
+    with _oauth_handler_lock:
+        if _oauth_handler is None:
+            creds_path = Path(os.environ.get("GOOGLE_OAUTH_CREDENTIALS", DEFAULT_CREDENTIALS_PATH))
+            token_path = Path(os.environ.get("GOOGLE_DRIVE_TOKEN_PATH", DEFAULT_TOKEN_PATH))
+            _oauth_handler = OAuthHandler(creds_path, token_path)
     
     return _oauth_handler
 
 
+def _decode_text(data: bytes, charset: Optional[str] = None) -> Any:
+    """Decode a response body as text, returning the raw bytes if it is not text.
+    
+    Pure-ASCII bodies (the common case for exports) skip the codec lookup and
+    exception setup entirely.
+    """
+    if data.isascii():
+        return data.decode("ascii")
+    try:
+        return data.decode(charset or "utf-8")
+    except (UnicodeDecodeError, LookupError):
+        return data
+
+
 def _drive_api(
     endpoint: str,
     method: str = "GET",
     params: Optional[Dict[str, Any]] = None,
     body: Optional[Dict[str, Any]] = None,
-    raw_response: bool = False,
+    mode: str = "json",
     upload: bool = False,
     file_content: Optional[bytes] = None,
-    content_type: Optional[str] = None
+    content_type: Optional[str] = None,
+    extra_headers: Optional[Dict[str, str]] = None
 ) -> Any:
-    """Make a Google Drive API request."""
+    """Make a Google Drive API request.
+    
+    Args:
+        extra_headers: Additional request headers (e.g. Range)
+        mode: How to return the response body - "json" (parsed dict),
+              "bytes" (raw body) or "text" (decoded with the response charset,
+              falling back to raw bytes if the body is not valid text)
+    """
     try:
         oauth = _get_oauth_handler()
         access_token = oauth.get_access_token()
@@ -306,6 +356,8 @@ def _drive_api(
     headers = {
         "Authorization": f"Bearer {access_token}"
     }
+    if extra_headers:
+        headers.update(extra_headers)
     
     try:
         data = None
@@ -337,20 +389,102 @@ def _drive_api(
         
         with urllib.request.urlopen(req, timeout=60) as response:
             response_data = response.read()
-            if raw_response:
+            if mode == "bytes":
                 return response_data
+            if mode == "text":
+                return _decode_text(response_data, response.headers.get_content_charset())
             if response_data:
                 return json.loads(response_data.decode())
             return {"success": True}
     
     except urllib.error.HTTPError as e:
-        error_body = e.read().decode()
-        try:
-            error_data = json.loads(error_body)
-            error_msg = error_data.get("error", {}).get("message", str(e))
-        except:
-            error_msg = error_body or str(e)
-        return {"success": False, "error": f"API Error ({e.code}): {error_msg}"}
+        return _http_error_result(e)
+    
+    except urllib.error.URLError as e:
+        return {"success": False, "error": f"Network error: {e.reason}"}
+    
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def _http_error_result(e: urllib.error.HTTPError) -> Dict[str, Any]:
+    """Turn a Drive API HTTPError into an error result."""
+    error_body = e.read().decode()
+    try:
+        error_data = json.loads(error_body)
+        error_msg = error_data.get("error", {}).get("message", str(e))
+    except:
+        error_msg = error_body or str(e)
+    return {"success": False, "error": f"API Error ({e.code}): {error_msg}"}
+
+
+def _resumable_upload(
+    endpoint: str,
+    method: str,
+    params: Optional[Dict[str, Any]],
+    metadata: Optional[Dict[str, Any]],
+    file_content: bytes,
+    content_type: str
+) -> Any:
+    """Upload large content with Drive's resumable protocol.
+    
+    Opens an upload session with the metadata, then PUTs the content in
+    RESUMABLE_CHUNK_SIZE pieces so no single request carries the whole body.
+    """
+    try:
+        access_token = _get_oauth_handler().get_access_token()
+    except FileNotFoundError as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        return {"success": False, "error": f"Authentication failed: {e}"}
+    
+    query = dict(params or {})
+    query["uploadType"] = "resumable"
+    url = f"{DRIVE_UPLOAD_BASE}/{endpoint}?{urllib.parse.urlencode(query)}"
+    total = len(file_content)
+    
+    try:
+        req = urllib.request.Request(
+            url,
+            data=json.dumps(metadata or {}).encode(),
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json; charset=UTF-8",
+                "X-Upload-Content-Type": content_type,
+                "X-Upload-Content-Length": str(total),
+            },
+            method=method
+        )
+        with urllib.request.urlopen(req, timeout=60) as response:
+            session_url = response.headers["Location"]
+        
+        view = memoryview(file_content)
+        offset = 0
+        while True:
+            end = min(offset + RESUMABLE_CHUNK_SIZE, total)
+            req = urllib.request.Request(
+                session_url,
+                data=view[offset:end],
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "Content-Length": str(end - offset),
+                    "Content-Range": f"bytes {offset}-{end - 1}/{total}",
+                },
+                method="PUT"
+            )
+            try:
+                with urllib.request.urlopen(req, timeout=60) as response:
+                    response_data = response.read()
+                    return json.loads(response_data.decode()) if response_data else {"success": True}
+            except urllib.error.HTTPError as e:
+                # 308 Resume Incomplete: continue after the last byte Drive stored
+                if e.code != 308:
+                    raise
+                received = e.headers.get("Range")
+                offset = int(received.rsplit("-", 1)[1]) + 1 if received else 0
+    
+    except urllib.error.HTTPError as e:
+        return _http_error_result(e)
     
     except urllib.error.URLError as e:
         return {"success": False, "error": f"Network error: {e.reason}"}
@@ -359,8 +493,61 @@ def _drive_api(
         return {"success": False, "error": str(e)}
 
 
+def _q_escape(value: str) -> str:
+    """Escape a user-supplied string for use inside a quoted Drive query term."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+_format_cache: Dict[tuple, Dict[str, Any]] = {}
+FORMAT_CACHE_MAX = 4096
+
+# File ID -> (MIME type, size) for files seen in earlier results, so read_file
+# can tell when fetching media alongside the metadata is worth it
+_file_types: Dict[str, Tuple[str, Optional[int]]] = {}
+
+# Runs read_file's speculative media fetch alongside its metadata request
+_read_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def _remember_file_type(file_id: str, mime_type: str, size: Optional[str]) -> None:
+    if len(_file_types) >= FORMAT_CACHE_MAX:
+        _file_types.clear()
+    _file_types[file_id] = (mime_type, int(size) if size is not None else None)
+
+
 def _format_file(file: Dict[str, Any]) -> Dict[str, Any]:
-    """Format file metadata for output."""
+    """Format file metadata for output.
+    
+    Results are memoized per (id, modifiedTime). Fields that can change
+    without bumping modifiedTime (parents, sharing, starring, trash) and the
+    set of fields the endpoint returned are part of the key as well.
+    """
+    if "id" in file and "mimeType" in file:
+        _remember_file_type(file["id"], file["mimeType"], file.get("size"))
+
+    modified = file.get("modifiedTime")
+    if not modified:
+        return _build_file(file)
+    
+    key = (
+        file.get("id"),
+        modified,
+        tuple(file),
+        tuple(file.get("parents", ())),
+        file.get("shared"),
+        file.get("starred"),
+        file.get("trashed"),
+    )
+    cached = _format_cache.get(key)
+    if cached is None:
+        if len(_format_cache) >= FORMAT_CACHE_MAX:
+            _format_cache.clear()
+        cached = _format_cache[key] = _build_file(file)
+    return cached
+
+
+def _build_file(file: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the output dict for a file's metadata."""
     return {
         "id": file.get("id"),
         "name": file.get("name"),
@@ -400,10 +587,13 @@ def list_files(
         order_by: Sort order (e.g., "name", "modifiedTime desc")
         include_trashed: Include trashed files
     """
+    if max_results <= 0:
+        return {"success": True, "files": [], "count": 0}
+    
     q_parts = []
     
     if folder_id:
-        q_parts.append(f"'{folder_id}' in parents")
+        q_parts.append(f"'{_q_escape(folder_id)}' in parents")
     
     if not include_trashed:
         q_parts.append("trashed = false")
@@ -414,7 +604,7 @@ def list_files(
     params = {
         "pageSize": min(max_results, 1000),
         "orderBy": order_by,
-        "fields": "files(id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink,webContentLink,owners,shared,starred,trashed,driveId)",
+        "fields": LIST_FIELDS,
         # Support Shared Drives (Team Drives)
         "supportsAllDrives": "true",
         "includeItemsFromAllDrives": "true",
@@ -444,7 +634,7 @@ def get_file(file_id: str) -> Dict[str, Any]:
         file_id: The file ID
     """
     params = {
-        "fields": "id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink,webContentLink,owners,shared,starred,trashed,description,driveId",
+        "fields": GET_FIELDS,
         # Support Shared Drives (Team Drives)
         "supportsAllDrives": "true",
     }
@@ -472,7 +662,10 @@ def search_files(
         max_results: Maximum results
         file_type: Filter by type: "folder", "document", "spreadsheet", "presentation", "pdf", "image"
     """
-    q_parts = [f"fullText contains '{query}'", "trashed = false"]
+    if max_results <= 0:
+        return {"success": True, "query": query, "files": [], "count": 0}
+    
+    q_parts = [f"fullText contains '{_q_escape(query)}'", "trashed = false"]
     
     type_map = {
         "folder": "mimeType = 'application/vnd.google-apps.folder'",
@@ -489,7 +682,7 @@ def search_files(
     params = {
         "q": " and ".join(q_parts),
         "pageSize": min(max_results, 1000),
-        "fields": "files(id,name,mimeType,size,modifiedTime,webViewLink,owners,driveId)",
+        "fields": SEARCH_FIELDS,
         # Support Shared Drives (Team Drives)
         "supportsAllDrives": "true",
         "includeItemsFromAllDrives": "true",
@@ -520,16 +713,30 @@ def read_file(file_id: str, max_size: int = 1000000) -> Dict[str, Any]:
     Note: For Google Docs/Sheets/Slides, exports as plain text/CSV.
           For binary files, returns base64 encoded content.
     """
-    # First get file metadata (with Shared Drive support)
+    # When an earlier result showed a regular, non-empty file within
+    # max_size, fetch its media alongside the metadata. The range still caps
+    # the download in case the file has grown since.
+    media_future = None
+    mime_type, size = _file_types.get(file_id, (None, None))
+    if mime_type not in GOOGLE_MIME_TYPES and size is not None and 0 < size <= max_size:
+        media_future = _read_executor.submit(
+            _drive_api,
+            f"files/{file_id}",
+            params={"alt": "media"},
+            mode="bytes",
+            extra_headers={"Range": f"bytes=0-{max_size}"}
+        )
     meta_result = _drive_api(f"files/{file_id}", params={
-        "fields": "id,name,mimeType,size",
+        "fields": READ_META_FIELDS,
         "supportsAllDrives": "true",
     })
+    content = media_future.result() if media_future is not None else None
     
     if "error" in meta_result:
         return {"success": False, "error": meta_result.get("error")}
     
     mime_type = meta_result.get("mimeType", "")
+    _remember_file_type(file_id, mime_type, meta_result.get("size"))
     name = meta_result.get("name", "")
     size = int(meta_result.get("size", 0))
     
@@ -546,54 +753,54 @@ def read_file(file_id: str, max_size: int = 1000000) -> Dict[str, Any]:
         content = _drive_api(
             f"files/{file_id}/export",
             params={"mimeType": export_type},
-            raw_response=True
+            mode="bytes" if export_type.startswith("image/") else "text"
         )
         
         if isinstance(content, dict) and "error" in content:
             return {"success": False, "error": content.get("error")}
         
-        try:
-            text_content = content.decode('utf-8')
+        if isinstance(content, str):
             return {
                 "success": True,
                 "file_id": file_id,
                 "name": name,
                 "mime_type": mime_type,
                 "exported_as": export_type,
-                "content": text_content,
+                "content": content,
                 "encoding": "utf-8"
             }
-        except:
-            return {
-                "success": True,
-                "file_id": file_id,
-                "name": name,
-                "mime_type": mime_type,
-                "exported_as": export_type,
-                "content": base64.b64encode(content).decode(),
-                "encoding": "base64"
-            }
-    
-    # Handle regular files
-    content = _drive_api(f"files/{file_id}", params={"alt": "media"}, raw_response=True)
+        return {
+            "success": True,
+            "file_id": file_id,
+            "name": name,
+            "mime_type": mime_type,
+            "exported_as": export_type,
+            "content": base64.b64encode(content).decode(),
+            "encoding": "base64"
+        }
     
+    # Handle regular files, using the speculative media fetch if it worked
+    if "size" in meta_result and size == 0:
+        content = b""
+    elif content is None or isinstance(content, dict):
+        # A failed speculative fetch may just mean the file changed since it
+        # was last seen; the plain request reports any real error
+        content = _drive_api(f"files/{file_id}", params={"alt": "media"}, mode="bytes")
     if isinstance(content, dict) and "error" in content:
         return {"success": False, "error": content.get("error")}
     
-    # Try to decode as text
     if mime_type.startswith("text/") or mime_type in ["application/json", "application/xml"]:
-        try:
-            text_content = content.decode('utf-8')
-            return {
-                "success": True,
-                "file_id": file_id,
-                "name": name,
-                "mime_type": mime_type,
-                "content": text_content,
-                "encoding": "utf-8"
-            }
-        except:
-            pass
+        content = _decode_text(content)
+    
+    if isinstance(content, str):
+        return {
+            "success": True,
+            "file_id": file_id,
+            "name": name,
+            "mime_type": mime_type,
+            "content": content,
+            "encoding": "utf-8"
+        }
     
     # Return as base64 for binary files
     return {
@@ -631,15 +838,27 @@ def create_file(
     if description:
         metadata["description"] = description
     
-    result = _drive_api(
-        "files",
-        method="POST",
-        params={"uploadType": "multipart"},
-        body=metadata,
-        upload=True,
-        file_content=content.encode('utf-8'),
-        content_type=mime_type
-    )
+    file_content = content.encode('utf-8')
+    
+    if len(file_content) > RESUMABLE_THRESHOLD:
+        result = _resumable_upload(
+            "files",
+            "POST",
+            {"fields": GET_FIELDS, "supportsAllDrives": "true"},
+            metadata,
+            file_content,
+            mime_type
+        )
+    else:
+        result = _drive_api(
+            "files",
+            method="POST",
+            params={"uploadType": "multipart", "fields": GET_FIELDS, "supportsAllDrives": "true"},
+            body=metadata,
+            upload=True,
+            file_content=file_content,
+            content_type=mime_type
+        )
     
     if "error" in result:
         return {"success": False, "error": result.get("error")}
@@ -674,7 +893,12 @@ def create_folder(
     if description:
         metadata["description"] = description
     
-    result = _drive_api("files", method="POST", body=metadata)
+    result = _drive_api(
+        "files",
+        method="POST",
+        params={"fields": GET_FIELDS, "supportsAllDrives": "true"},
+        body=metadata
+    )
     
     if "error" in result:
         return {"success": False, "error": result.get("error")}
@@ -702,14 +926,25 @@ def update_file(
     """
     if content:
         # Update content (with Shared Drive support)
-        result = _drive_api(
-            f"files/{file_id}",
-            method="PATCH",
-            params={"uploadType": "media", "supportsAllDrives": "true"},
-            upload=True,
-            file_content=content.encode('utf-8'),
-            content_type="text/plain"
-        )
+        file_content = content.encode('utf-8')
+        if len(file_content) > RESUMABLE_THRESHOLD:
+            result = _resumable_upload(
+                f"files/{file_id}",
+                "PATCH",
+                {"fields": GET_FIELDS, "supportsAllDrives": "true"},
+                None,
+                file_content,
+                "text/plain"
+            )
+        else:
+            result = _drive_api(
+                f"files/{file_id}",
+                method="PATCH",
+                params={"uploadType": "media", "fields": GET_FIELDS, "supportsAllDrives": "true"},
+                upload=True,
+                file_content=file_content,
+                content_type="text/plain"
+            )
     else:
         # Update metadata only (with Shared Drive support)
         metadata = {}
@@ -721,7 +956,12 @@ def update_file(
         if not metadata:
             return {"success": False, "error": "No updates specified"}
         
-        result = _drive_api(f"files/{file_id}", method="PATCH", params={"supportsAllDrives": "true"}, body=metadata)
+        result = _drive_api(
+            f"files/{file_id}",
+            method="PATCH",
+            params={"fields": GET_FIELDS, "supportsAllDrives": "true"},
+            body=metadata
+        )
     
     if "error" in result:
         return {"success": False, "error": result.get("error")}
@@ -755,19 +995,27 @@ def delete_file(file_id: str, permanent: bool = False) -> Dict[str, Any]:
     }
 
 
-def move_file(file_id: str, new_parent_id: str) -> Dict[str, Any]:
+def move_file(
+    file_id: str,
+    new_parent_id: str,
+    current_parent_id: Optional[str] = None
+) -> Dict[str, Any]:
     """Move file to a different folder.
     
     Args:
         file_id: The file ID
         new_parent_id: New parent folder ID
+        current_parent_id: Current parent folder ID, if known (skips a lookup)
     """
-    # Get current parents (with Shared Drive support)
-    current = _drive_api(f"files/{file_id}", params={"fields": "parents", "supportsAllDrives": "true"})
-    if "error" in current:
-        return {"success": False, "error": current.get("error")}
-    
-    current_parents = ",".join(current.get("parents", []))
+    if current_parent_id:
+        current_parents = current_parent_id
+    else:
+        # Get current parents (with Shared Drive support)
+        current = _drive_api(f"files/{file_id}", params={"fields": "parents", "supportsAllDrives": "true"})
+        if "error" in current:
+            return {"success": False, "error": current.get("error")}
+        
+        current_parents = ",".join(current.get("parents", []))
     
     result = _drive_api(
         f"files/{file_id}",
@@ -790,6 +1038,43 @@ def move_file(file_id: str, new_parent_id: str) -> Dict[str, Any]:
     }
 
 
+MOVE_ENTRY_KEYS = {"file_id", "new_parent_id", "current_parent_id"}
+
+
+def move_files(moves: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Move several files concurrently.
+    
+    Args:
+        moves: List of {"file_id", "new_parent_id", "current_parent_id"?} entries
+    """
+    if not moves:
+        return {"success": True, "results": [], "count": 0}
+    
+    def _move_one(entry: Any) -> Dict[str, Any]:
+        if not isinstance(entry, dict):
+            return {"success": False, "error": "Each move must be an object"}
+        unknown = set(entry) - MOVE_ENTRY_KEYS
+        if unknown:
+            return {"success": False, "error": f"Unknown keys: {', '.join(sorted(unknown))}"}
+        if not entry.get("file_id") or not entry.get("new_parent_id"):
+            return {"success": False, "error": "file_id and new_parent_id are required"}
+        try:
+            return move_file(**entry)
+        except Exception as e:
+            return {"success": False, "file_id": entry["file_id"], "error": str(e)}
+    
+    with ThreadPoolExecutor(max_workers=min(len(moves), 8)) as pool:
+        results = list(pool.map(_move_one, moves))
+    
+    failed = sum(1 for r in results if not r.get("success"))
+    return {
+        "success": failed == 0,
+        "results": results,
+        "count": len(results),
+        "failed": failed
+    }
+
+
 def copy_file(
     file_id: str,
     new_name: Optional[str] = None,
@@ -808,7 +1093,12 @@ def copy_file(
     if parent_id:
         body["parents"] = [parent_id]
     
-    result = _drive_api(f"files/{file_id}/copy", method="POST", params={"supportsAllDrives": "true"}, body=body if body else None)
+    result = _drive_api(
+        f"files/{file_id}/copy",
+        method="POST",
+        params={"fields": GET_FIELDS, "supportsAllDrives": "true"},
+        body=body if body else None
+    )
     
     if "error" in result:
         return {"success": False, "error": result.get("error")}
@@ -836,6 +1126,9 @@ def share_file(
         notify: Send notification email
         message: Custom message for notification
     """
+    if "@" not in email or email.strip() != email:
+        return {"success": False, "error": f"Invalid email address: {email!r}"}
+    
     body = {
         "type": "user",
         "role": role,
@@ -873,7 +1166,7 @@ def get_file_permissions(file_id: str) -> Dict[str, Any]:
     result = _drive_api(
         f"files/{file_id}/permissions",
         params={
-            "fields": "permissions(id,type,role,emailAddress,displayName)",
+            "fields": PERMISSION_FIELDS,
             "supportsAllDrives": "true",
         }
     )
@@ -1103,11 +1396,38 @@ TOOLS = [
                 "new_parent_id": {
                     "type": "string",
                     "description": "New parent folder ID"
+                },
+                "current_parent_id": {
+                    "type": "string",
+                    "description": "Current parent folder ID, if known (saves a lookup)"
                 }
             },
             "required": ["file_id", "new_parent_id"]
         }
     },
+    {
+        "name": "move_files",
+        "description": "Move several files to different folders concurrently.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "moves": {
+                    "type": "array",
+                    "description": "Moves to perform",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file_id": {"type": "string"},
+                            "new_parent_id": {"type": "string"},
+                            "current_parent_id": {"type": "string"}
+                        },
+                        "required": ["file_id", "new_parent_id"]
+                    }
+                }
+            },
+            "required": ["moves"]
+        }
+    },
     {
         "name": "copy_file",
         "description": "Copy a file.",
@@ -1179,103 +1499,136 @@ TOOLS = [
 ]
 
 
-def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Handle incoming MCP request."""
-    method = request.get("method", "")
-    req_id = request.get("id")
-    params = request.get("params", {})
+TOOL_FUNCTIONS = {
+    "list_files": list_files,
+    "get_file": get_file,
+    "search_files": search_files,
+    "read_file": read_file,
+    "create_file": create_file,
+    "create_folder": create_folder,
+    "update_file": update_file,
+    "delete_file": delete_file,
+    "move_file": move_file,
+    "move_files": move_files,
+    "copy_file": copy_file,
+    "share_file": share_file,
+    "get_file_permissions": get_file_permissions
+}
 
-    if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {}},
-                "serverInfo": {"name": "google-drive", "version": "1.0.0"}
-            }
-        }
 
-    elif method == "tools/list":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {"tools": TOOLS}
+def _handle_initialize(req_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "result": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "google-drive", "version": "1.0.0"}
         }
+    }
 
-    elif method == "tools/call":
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-
-        tool_functions = {
-            "list_files": list_files,
-            "get_file": get_file,
-            "search_files": search_files,
-            "read_file": read_file,
-            "create_file": create_file,
-            "create_folder": create_folder,
-            "update_file": update_file,
-            "delete_file": delete_file,
-            "move_file": move_file,
-            "copy_file": copy_file,
-            "share_file": share_file,
-            "get_file_permissions": get_file_permissions
-        }
 
-        if tool_name in tool_functions:
-            try:
-                result = tool_functions[tool_name](**arguments)
-            except TypeError as e:
-                result = {"success": False, "error": f"Invalid arguments: {e}"}
-            except Exception as e:
-                result = {"success": False, "error": str(e)}
-        else:
-            result = {"success": False, "error": f"Unknown tool: {tool_name}"}
+def _handle_tools_list(req_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "result": {"tools": TOOLS}
+    }
 
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "content": [{"type": "text", "text": json.dumps(result, indent=2)}]
-            }
-        }
 
-    elif method == "notifications/initialized":
-        return None
+def _handle_tools_call(req_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
 
+    tool = TOOL_FUNCTIONS.get(tool_name)
+    if tool is not None:
+        try:
+            result = tool(**arguments)
+        except TypeError as e:
+            result = {"success": False, "error": f"Invalid arguments: {e}"}
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
     else:
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "error": {"code": -32601, "message": f"Method not found: {method}"}
+        result = {"success": False, "error": f"Unknown tool: {tool_name}"}
+
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "result": {
+            "content": [{"type": "text", "text": json.dumps(result, indent=2)}]
         }
+    }
+
+
+def _handle_notification(req_id: Any, params: Dict[str, Any]) -> None:
+    return None
+
+
+METHOD_HANDLERS = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "notifications/initialized": _handle_notification,
+}
+
+
+def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Handle incoming MCP request."""
+    method = request.get("method", "")
+    req_id = request.get("id")
+    params = request.get("params", {})
+
+    handler = METHOD_HANDLERS.get(method)
+    if handler is not None:
+        return handler(req_id, params)
+
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "error": {"code": -32601, "message": f"Method not found: {method}"}
+    }
+
+
+def _write_message(message: Dict[str, Any]):
+    """Write a JSON-RPC message to stdout as a single line."""
+    if ORJSON_AVAILABLE:
+        sys.stdout.buffer.write(orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
 
 
 def main():
     """Main MCP server loop using stdio."""
+    # Read raw bytes: skips the text-layer decode and lets the JSON parser
+    # work on the line directly
+    readline = sys.stdin.buffer.readline
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    
     while True:
         try:
-            line = sys.stdin.readline()
+            line = readline()
             if not line:
                 break
 
-            request = json.loads(line)
+            try:
+                request = loads(line)
+            except ValueError:
+                # Malformed JSON (json and orjson decode errors are ValueErrors)
+                continue
+
             response = handle_request(request)
 
             if response:
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
+                _write_message(response)
 
-        except json.JSONDecodeError:
-            continue
         except Exception as e:
             error_response = {
                 "jsonrpc": "2.0",
                 "id": None,
                 "error": {"code": -32603, "message": str(e)}
             }
-            sys.stdout.write(json.dumps(error_response) + "\n")
-            sys.stdout.flush()
+            _write_message(error_response)
 
 
 if __name__ == "__main__":
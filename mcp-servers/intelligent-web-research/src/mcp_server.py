@@ -18,11 +18,33 @@ import sys
 import os
 import subprocess
 import shutil
+import copy
+import re
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Optional, Dict, List
+from functools import lru_cache
+from typing import Any, Optional, Dict, List, Union
 from urllib.parse import quote_plus
 
+# Optional: orjson is a much faster drop-in for the JSON-RPC framing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional (macOS): pyobjc opens URLs through NSWorkspace in-process instead
+# of forking /usr/bin/open for every URL
+NSWORKSPACE_AVAILABLE = False
+if sys.platform == "darwin":
+    try:
+        from AppKit import NSWorkspace
+        from Foundation import NSURL
+        NSWORKSPACE_AVAILABLE = True
+    except ImportError:
+        pass
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -33,6 +55,9 @@ COMET_BROWSER_PATH = os.environ.get(
 )
 DEFAULT_BROWSER = os.environ.get("DEFAULT_BROWSER", "comet")  # comet, chrome, safari, firefox
 
+# Pretty-print tool results (indent=2); compact output is smaller and faster
+PRETTY_JSON = os.environ.get("WEB_RESEARCH_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
 # Search engine URLs
 SEARCH_ENGINES = {
     "perplexity": "https://www.perplexity.ai/search?q={query}",
@@ -54,10 +79,96 @@ RESEARCH_DOMAINS = {
     "news": ["reuters.com", "apnews.com", "bbc.com"],
     "business": ["sec.gov", "bloomberg.com", "crunchbase.com"],
 }
+
+# Query keywords that hint at a research domain, in priority order
+DOMAIN_KEYWORDS = {
+    "government": ["policy", "regulation", "federal", "state", "legislation", "compliance"],
+    "tech": ["api", "code", "programming", "github", "bug", "feature"],
+    "academic": ["paper", "research", "study", "journal", "arxiv"],
+    "news": ["today", "yesterday", "breaking", "recent", "latest"],
+    "business": ["company", "startup", "funding", "sec", "earnings"],
+}
+
+# One compiled case-insensitive alternation per domain (substring semantics)
+DOMAIN_PATTERNS = [
+    (domain, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for domain, keywords in DOMAIN_KEYWORDS.items()
+]
+
+# Queries that ask for verification get the multi-source validation plan
+VALIDATION_PATTERN = re.compile("verify|fact check", re.IGNORECASE)
+
+# How long detect_capabilities() results are reused (seconds)
+CAPABILITIES_CACHE_TTL = 300
 # ============================================================================
 
+_capabilities_cache: Optional[Dict[str, Any]] = None
+_capabilities_cached_at: float = 0.0
+
+
+_year: int = datetime.now().year
+_year_checked_at: float = time.time()
+
+
+def _current_year() -> int:
+    """Current year, re-read from the clock at most once an hour."""
+    global _year, _year_checked_at
+    now = time.time()
+    if now - _year_checked_at > 3600:
+        _year = datetime.now().year
+        _year_checked_at = now
+    return _year
 
-def detect_capabilities() -> Dict[str, Any]:
+
+def _invalidate_capabilities_cache() -> None:
+    """Force the next detect_capabilities() call to re-scan the system."""
+    global _capabilities_cache
+    _capabilities_cache = None
+    _path_exists.cache_clear()
+    _path_executables.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _path_exists(path: str) -> bool:
+    """Cached os.path.exists for install paths that don't change mid-session."""
+    return os.path.exists(path)
+
+
+@lru_cache(maxsize=1)
+def _path_executables() -> frozenset:
+    """Names of the executable files in every $PATH directory, from a single scan.
+
+    Probing several tools this way lists each directory once instead of
+    having shutil.which() re-walk $PATH for every name. As with which(),
+    only regular files with execute permission count.
+    """
+    names = set()
+    pathext = os.environ.get("PATHEXT", "").lower().split(os.pathsep) if os.name == "nt" else []
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            entries = list(os.scandir(directory or "."))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if not entry.is_file() or not os.access(entry.path, os.X_OK):
+                    continue
+            except OSError:
+                continue
+            names.add(entry.name)
+            if pathext:
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in pathext:
+                    names.add(stem)
+    return frozenset(names)
+
+
+def _comet_available() -> bool:
+    """Whether the Comet browser binary is installed."""
+    return _path_exists(COMET_BROWSER_PATH)
+
+
+def detect_capabilities(refresh: bool = False) -> Dict[str, Any]:
     """
     Detect available web search and browsing capabilities.
 
@@ -67,9 +178,37 @@ def detect_capabilities() -> Dict[str, Any]:
     3. CLI tools (curl, wget)
     4. Search engine accessibility
 
+    Installed browsers and tools rarely change mid-session, so the scan is
+    cached for CAPABILITIES_CACHE_TTL seconds; "timestamp" reports when the
+    scan ran.
+
+    Args:
+        refresh: Ignore the cache and re-scan
+
     Returns:
         Dict with capability status and recommended methods
     """
+    global _capabilities_cache, _capabilities_cached_at
+
+    if refresh:
+        _invalidate_capabilities_cache()
+
+    now = time.time()
+    if (
+        _capabilities_cache is not None
+        and now - _capabilities_cached_at < CAPABILITIES_CACHE_TTL
+    ):
+        # "timestamp" is left as the time of the scan that produced the data
+        return copy.deepcopy(_capabilities_cache)
+
+    capabilities = _scan_capabilities()
+    _capabilities_cache = copy.deepcopy(capabilities)
+    _capabilities_cached_at = now
+    return capabilities
+
+
+def _scan_capabilities() -> Dict[str, Any]:
+    """Probe the system for browsers and CLI tools."""
     capabilities = {
         "timestamp": datetime.now().isoformat(),
         "builtin_tools": {
@@ -92,8 +231,9 @@ def detect_capabilities() -> Dict[str, Any]:
         "arc": "/Applications/Arc.app/Contents/MacOS/Arc",
     }
 
+    on_path = _path_executables()
     for browser, path in browsers_to_check.items():
-        exists = os.path.exists(path) or shutil.which(browser) is not None
+        exists = _path_exists(path) or browser in on_path
         capabilities["browsers"][browser] = {
             "available": exists,
             "path": path if exists else None
@@ -104,18 +244,19 @@ def detect_capabilities() -> Dict[str, Any]:
     # Check CLI tools
     cli_tools = ["curl", "wget", "open"]
     for tool in cli_tools:
-        capabilities["cli_tools"][tool] = shutil.which(tool) is not None
+        capabilities["cli_tools"][tool] = tool in on_path
 
     # Determine recommended method
-    if capabilities["browsers"].get("comet", {}).get("available"):
+    available_browsers = {b for b, info in capabilities["browsers"].items() if info["available"]}
+    if "comet" in available_browsers:
         capabilities["recommended_method"] = "comet_browser"
         capabilities["reason"] = "Comet browser available - supports Perplexity AI search"
         capabilities["primary_strategy"] = "agentic_browser_navigation"
-    elif capabilities["browsers"].get("arc", {}).get("available"):
+    elif "arc" in available_browsers:
         capabilities["recommended_method"] = "arc_browser"
         capabilities["reason"] = "Arc browser available - supports AI features"
         capabilities["primary_strategy"] = "agentic_browser_navigation"
-    elif any(capabilities["browsers"].get(b, {}).get("available") for b in ["chrome", "safari", "firefox"]):
+    elif available_browsers & {"chrome", "safari", "firefox"}:
         capabilities["recommended_method"] = "standard_browser"
         capabilities["reason"] = "Standard browser available for web research"
         capabilities["primary_strategy"] = "agentic_browser_navigation"
@@ -140,13 +281,101 @@ def detect_capabilities() -> Dict[str, Any]:
     return capabilities
 
 
+@lru_cache(maxsize=512)
 def build_search_url(query: str, engine: str = "perplexity") -> str:
     """Build a search URL for the specified engine."""
-    if engine not in SEARCH_ENGINES:
-        engine = "perplexity"
+    template = SEARCH_ENGINES.get(engine) or SEARCH_ENGINES["perplexity"]
+    return template.format(query=quote_plus(query))
+
+
+# Browser processes launched by this server (name -> pid), kept so later
+# URLs can be handed to the running instance
+_browser_pids: Dict[str, int] = {}
+
+# Children started with posix_spawn that have not been reaped yet
+_spawned_pids: set = set()
+_devnull_fd: Optional[int] = None
+
+# System "open URL" command, resolved once for this platform
+if sys.platform == "darwin":
+    OPEN_COMMAND, OPEN_USES_SHELL = ["open"], False
+elif sys.platform.startswith("linux"):
+    OPEN_COMMAND, OPEN_USES_SHELL = ["xdg-open"], False
+else:
+    OPEN_COMMAND, OPEN_USES_SHELL = ["start"], True
+
+# Absolute path of the open command, so spawning skips the $PATH search
+# ("start" is a shell builtin and has no binary)
+OPEN_BINARY = None if OPEN_USES_SHELL else shutil.which(OPEN_COMMAND[0])
+
+NULL_IO = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+
+def _reap_children() -> None:
+    """Collect exit statuses of finished posix_spawn children (no zombies)."""
+    for pid in list(_spawned_pids):
+        try:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished = pid
+        if finished:
+            _spawned_pids.discard(pid)
 
-    encoded_query = quote_plus(query)
-    return SEARCH_ENGINES[engine].format(query=encoded_query)
+
+def _spawn_detached(argv: List[str], shell: bool = False) -> int:
+    """Launch a fire-and-forget process with stdio on /dev/null; returns its pid.
+
+    Uses a single posix_spawn call where available instead of subprocess's
+    fork/exec machinery; Windows (and shell launches) go through Popen.
+    """
+    global _devnull_fd
+    if shell or not hasattr(os, "posix_spawnp"):
+        return subprocess.Popen(argv, shell=shell, **NULL_IO).pid
+
+    _reap_children()
+    if _devnull_fd is None:
+        _devnull_fd = os.open(os.devnull, os.O_RDWR)
+    spawn = os.posix_spawn if os.path.isabs(argv[0]) else os.posix_spawnp
+    pid = spawn(argv[0], argv, os.environ, file_actions=[
+        (os.POSIX_SPAWN_DUP2, _devnull_fd, 0),
+        (os.POSIX_SPAWN_DUP2, _devnull_fd, 1),
+        (os.POSIX_SPAWN_DUP2, _devnull_fd, 2),
+    ])
+    _spawned_pids.add(pid)
+    return pid
+
+
+def _pid_running(pid: int) -> bool:
+    """Whether a process started by _spawn_detached is still alive."""
+    _reap_children()
+    return pid in _spawned_pids
+
+
+def _spawn_default(url: str) -> None:
+    """Open a URL with the platform's default handler."""
+    if NSWORKSPACE_AVAILABLE:
+        ns_url = NSURL.URLWithString_(url)
+        if ns_url is not None and NSWorkspace.sharedWorkspace().openURL_(ns_url):
+            return
+    if OPEN_USES_SHELL:
+        _spawn_detached(OPEN_COMMAND + [url], shell=True)
+        return
+    if OPEN_BINARY is None:
+        raise FileNotFoundError(f"'{OPEN_COMMAND[0]}' not found on PATH - cannot open URLs")
+    _spawn_detached([OPEN_BINARY, url])
+
+
+def _open_in_comet(url: str) -> None:
+    """Open a URL in Comet, reusing the instance this server launched."""
+    pid = _browser_pids.get("comet")
+    if pid is not None and _pid_running(pid):
+        if sys.platform == "darwin" and OPEN_BINARY and ".app/" in COMET_BROWSER_PATH:
+            # LaunchServices hands the URL to the running app - no cold start
+            app_bundle = COMET_BROWSER_PATH.split(".app/")[0] + ".app"
+            _spawn_detached([OPEN_BINARY, "-a", app_bundle, url])
+            return
+
+    _browser_pids["comet"] = _spawn_detached([COMET_BROWSER_PATH, url])
 
 
 def open_browser(url: str, browser: str = "default") -> Dict[str, Any]:
@@ -163,10 +392,8 @@ def open_browser(url: str, browser: str = "default") -> Dict[str, Any]:
     try:
         if browser == "default" or browser == "comet":
             # Check if Comet is available
-            if os.path.exists(COMET_BROWSER_PATH):
-                subprocess.Popen([COMET_BROWSER_PATH, url],
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
+            if _comet_available():
+                _open_in_comet(url)
                 return {
                     "success": True,
                     "browser": "comet",
@@ -175,18 +402,7 @@ def open_browser(url: str, browser: str = "default") -> Dict[str, Any]:
                 }
 
         # Fallback to system default
-        if sys.platform == "darwin":
-            subprocess.Popen(["open", url],
-                           stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL)
-        elif sys.platform == "linux":
-            subprocess.Popen(["xdg-open", url],
-                           stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL)
-        else:
-            subprocess.Popen(["start", url], shell=True,
-                           stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL)
+        _spawn_default(url)
 
         return {
             "success": True,
@@ -239,16 +455,81 @@ def open_research_browser(
         result["recommended_sources"] = RESEARCH_DOMAINS[topic_domain]
         result["guidance"] = f"After AI search, validate with domain sources: {', '.join(RESEARCH_DOMAINS[topic_domain])}"
 
-    result["next_steps"] = [
-        "1. Review AI-synthesized answer in browser",
-        "2. Check cited sources for accuracy",
-        "3. Use WebFetch to capture specific URLs",
-        "4. Cross-validate critical claims with 3+ sources"
-    ]
+    result["next_steps"] = NEXT_STEPS
 
     return result
 
 
+# Query-independent parts of the research plans, shared between calls
+# (results are only serialized, never mutated)
+NEXT_STEPS = (
+    "1. Review AI-synthesized answer in browser",
+    "2. Check cited sources for accuracy",
+    "3. Use WebFetch to capture specific URLs",
+    "4. Cross-validate critical claims with 3+ sources"
+)
+
+VALIDATION_STATIC_STEPS = (
+    {
+        "step": 4,
+        "action": "webfetch",
+        "description": "Fetch authoritative sources",
+        "params": {"note": "Fetch top 3 most authoritative URLs from step 2"}
+    },
+    {
+        "step": 5,
+        "action": "validate",
+        "description": "Cross-reference claims",
+        "params": {"requirement": "3+ independent sources must agree"}
+    },
+)
+
+DEEP_RESEARCH_STATIC_STEPS = (
+    {
+        "step": 3,
+        "action": "analyze_and_navigate",
+        "description": "Analyze results and select next URL",
+        "params": {"note": "Identify most promising link to explore"}
+    },
+    {
+        "step": 4,
+        "action": "browser_navigate",
+        "description": "Open selected URL in browser AND fetch content",
+        "params": {
+            "actions": [
+                "open_url(url=selected_url)",
+                "webfetch(url=selected_url)"
+            ]
+        }
+    },
+    {
+        "step": 5,
+        "action": "synthesize",
+        "description": "Synthesize findings or continue navigation",
+        "params": {"note": "Repeat steps 3-4 if more info needed"}
+    },
+)
+
+VERIFY_DATE_STEP = {
+    "step": 2,
+    "action": "verify_date",
+    "description": "Verify publication dates",
+    "params": {"requirement": "Results must be from last 7 days"}
+}
+
+GENERAL_FETCH_STEP = {
+    "step": 2,
+    "action": "webfetch",
+    "description": "Fetch relevant URLs for details",
+    "params": {"note": "If needed, fetch specific pages for deeper content"}
+}
+
+FALLBACK_METHODS = (
+    {"method": "browser", "when": "WebSearch returns limited results"},
+    {"method": "manual", "when": "Critical data not found via automated search"},
+)
+
+
 def get_search_strategy(
     query: str,
     purpose: str = "general",
@@ -280,26 +561,17 @@ def get_search_strategy(
         "fallback_methods": [],
     }
 
-    # Determine query type
-    query_lower = query.lower()
-
-    # Check for specific domains
+    # Check for specific domains (first matching domain wins)
     detected_domain = None
-    for domain, keywords in {
-        "government": ["policy", "regulation", "federal", "state", "legislation", "compliance"],
-        "tech": ["api", "code", "programming", "github", "bug", "feature"],
-        "academic": ["paper", "research", "study", "journal", "arxiv"],
-        "news": ["today", "yesterday", "breaking", "recent", "latest"],
-        "business": ["company", "startup", "funding", "sec", "earnings"],
-    }.items():
-        if any(kw in query_lower for kw in keywords):
+    for domain, pattern in DOMAIN_PATTERNS:
+        if pattern.search(query):
             detected_domain = domain
             break
 
     strategy["detected_domain"] = detected_domain
 
     # Build search steps based on purpose
-    if purpose == "validation" or "verify" in query_lower or "fact check" in query_lower:
+    if purpose == "validation" or VALIDATION_PATTERN.search(query):
         strategy["primary_method"] = "multi_source"
         strategy["steps"] = [
             {
@@ -320,18 +592,7 @@ def get_search_strategy(
                 "description": "Search for counter-evidence",
                 "params": {"query": f"{query} criticism OR debunked OR false"}
             },
-            {
-                "step": 4,
-                "action": "webfetch",
-                "description": "Fetch authoritative sources",
-                "params": {"note": "Fetch top 3 most authoritative URLs from step 2"}
-            },
-            {
-                "step": 5,
-                "action": "validate",
-                "description": "Cross-reference claims",
-                "params": {"requirement": "3+ independent sources must agree"}
-            }
+            *VALIDATION_STATIC_STEPS
         ]
         strategy["validation_required"] = True
         strategy["min_sources"] = 3
@@ -352,29 +613,7 @@ def get_search_strategy(
                 "description": "Get initial search results (AI View)",
                 "params": {"query": query}
             },
-            {
-                "step": 3,
-                "action": "analyze_and_navigate",
-                "description": "Analyze results and select next URL",
-                "params": {"note": "Identify most promising link to explore"}
-            },
-            {
-                "step": 4,
-                "action": "browser_navigate",
-                "description": "Open selected URL in browser AND fetch content",
-                "params": {
-                    "actions": [
-                        "open_url(url=selected_url)",
-                        "webfetch(url=selected_url)"
-                    ]
-                }
-            },
-            {
-                "step": 5,
-                "action": "synthesize",
-                "description": "Synthesize findings or continue navigation",
-                "params": {"note": "Repeat steps 3-4 if more info needed"}
-            }
+            *DEEP_RESEARCH_STATIC_STEPS
         ]
 
     elif freshness == "today" or freshness == "recent":
@@ -383,14 +622,9 @@ def get_search_strategy(
                 "step": 1,
                 "action": "websearch",
                 "description": f"Search with recency filter",
-                "params": {"query": f"{query} {datetime.now().year}"}
+                "params": {"query": f"{query} {_current_year()}"}
             },
-            {
-                "step": 2,
-                "action": "verify_date",
-                "description": "Verify publication dates",
-                "params": {"requirement": "Results must be from last 7 days"}
-            }
+            VERIFY_DATE_STEP
         ]
         strategy["freshness_warning"] = "Reject any sources older than 7 days for this query"
 
@@ -403,12 +637,7 @@ def get_search_strategy(
                 "description": "Primary web search",
                 "params": {"query": query}
             },
-            {
-                "step": 2,
-                "action": "webfetch",
-                "description": "Fetch relevant URLs for details",
-                "params": {"note": "If needed, fetch specific pages for deeper content"}
-            }
+            GENERAL_FETCH_STEP
         ]
 
     # Add domain-specific sources
@@ -417,124 +646,162 @@ def get_search_strategy(
         strategy["domain_guidance"] = f"For {detected_domain} queries, prioritize: {', '.join(RESEARCH_DOMAINS[detected_domain])}"
 
     # Add fallback methods
-    strategy["fallback_methods"] = [
-        {"method": "browser", "when": "WebSearch returns limited results"},
-        {"method": "manual", "when": "Critical data not found via automated search"}
-    ]
+    strategy["fallback_methods"] = FALLBACK_METHODS
 
     return strategy
 
 
-def get_data_freshness_protocol() -> Dict[str, Any]:
+def research_session_start(
+    query: str,
+    search_engine: str = "perplexity",
+    purpose: str = "general",
+    freshness: str = "any",
+    topic_domain: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    Return the Data Freshness Protocol for consistent web search usage.
+    Start a research session in one call: open the browser and plan the search.
 
-    This protocol ensures all skills follow the same pattern for
-    obtaining and validating fresh web data.
+    Equivalent to open_research_browser followed by get_search_strategy,
+    saving a round trip at the start of every session.
+
+    Args:
+        query: Search query or research question
+        search_engine: Search engine (perplexity, chatgpt, google, etc.)
+        purpose: Purpose of search (general, validation, deep_research, fact_check)
+        freshness: Data freshness requirement (any, recent, today)
+        topic_domain: Optional domain hint (government, tech, academic, etc.)
 
     Returns:
-        Dict with the complete data freshness protocol
+        Dict with the browser result and the search strategy
     """
     return {
-        "name": "Data Freshness Protocol v1.1",
-        "description": "Mandatory protocol for obtaining and validating web data",
-        "hierarchy": {
-            "tier_1": {
-                "source": "Agentic Browser (Open + Fetch)",
-                "when": "ALWAYS try first. Open browser for user visibility, use WebSearch/WebFetch for AI data.",
-                "example": "open_research_browser(...) AND WebSearch(...)"
-            },
-            "tier_2": {
-                "source": "WebSearch (Real-time fallback)",
-                "when": "If browser unavailable or for quick fact checks.",
-                "example": "WebSearch('Python 3.12 new features 2024')"
-            },
-            "tier_3": {
-                "source": "WebFetch (Targeted)",
-                "when": "Fetch specific authoritative URLs found in Tier 1/2",
-                "example": "WebFetch('https://docs.python.org/3/')"
-            },
-            "tier_4": {
-                "source": "Training knowledge",
-                "when": "ONLY as last resort, ONLY for stable facts",
-                "warning": "Mark as [TRAINING DATA - VERIFY] if used"
-            }
+        "browser": open_research_browser(query, search_engine, topic_domain),
+        "strategy": get_search_strategy(query, purpose, freshness),
+    }
+
+
+# The protocol is static; built once and returned by reference (callers only
+# serialize it)
+DATA_FRESHNESS_PROTOCOL = {
+    "name": "Data Freshness Protocol v1.1",
+    "description": "Mandatory protocol for obtaining and validating web data",
+    "hierarchy": {
+        "tier_1": {
+            "source": "Agentic Browser (Open + Fetch)",
+            "when": "ALWAYS try first. Open browser for user visibility, use WebSearch/WebFetch for AI data.",
+            "example": "open_research_browser(...) AND WebSearch(...)"
         },
-        "validation_rules": {
-            "critical_claims": "Require 3+ independent sources",
-            "dates_events": "Must have dated source (reject 'generally' or 'usually')",
-            "statistics": "Must cite original study/report",
-            "policies": "Must cite official source (gov, org official docs)"
+        "tier_2": {
+            "source": "WebSearch (Real-time fallback)",
+            "when": "If browser unavailable or for quick fact checks.",
+            "example": "WebSearch('Python 3.12 new features 2024')"
         },
-        "freshness_thresholds": {
-            "trending_topics": "< 7 days",
-            "policy_regulatory": "< 30 days for 'current' claims",
-            "stable_facts": "No strict requirement, but verify still accurate"
+        "tier_3": {
+            "source": "WebFetch (Targeted)",
+            "when": "Fetch specific authoritative URLs found in Tier 1/2",
+            "example": "WebFetch('https://docs.python.org/3/')"
         },
-        "rejection_criteria": [
-            "Source has no date",
-            "Source is > 1 year old for time-sensitive topics",
-            "Cannot find 3 sources agreeing",
-            "Only AI-generated content without citations"
-        ],
-        "output_format": {
-            "verified_claim": "[VERIFIED] Claim text (Source: URL, Date: YYYY-MM-DD)",
-            "unverified": "[UNVERIFIED - LOW CONFIDENCE] Claim text",
-            "stale_data": "[STALE - VERIFY] Claim text (Last verified: YYYY-MM-DD)"
+        "tier_4": {
+            "source": "Training knowledge",
+            "when": "ONLY as last resort, ONLY for stable facts",
+            "warning": "Mark as [TRAINING DATA - VERIFY] if used"
         }
+    },
+    "validation_rules": {
+        "critical_claims": "Require 3+ independent sources",
+        "dates_events": "Must have dated source (reject 'generally' or 'usually')",
+        "statistics": "Must cite original study/report",
+        "policies": "Must cite official source (gov, org official docs)"
+    },
+    "freshness_thresholds": {
+        "trending_topics": "< 7 days",
+        "policy_regulatory": "< 30 days for 'current' claims",
+        "stable_facts": "No strict requirement, but verify still accurate"
+    },
+    "rejection_criteria": [
+        "Source has no date",
+        "Source is > 1 year old for time-sensitive topics",
+        "Cannot find 3 sources agreeing",
+        "Only AI-generated content without citations"
+    ],
+    "output_format": {
+        "verified_claim": "[VERIFIED] Claim text (Source: URL, Date: YYYY-MM-DD)",
+        "unverified": "[UNVERIFIED - LOW CONFIDENCE] Claim text",
+        "stale_data": "[STALE - VERIFY] Claim text (Last verified: YYYY-MM-DD)"
     }
+}
+
+
+def get_data_freshness_protocol() -> Dict[str, Any]:
+    """
+    Return the Data Freshness Protocol for consistent web search usage.
+
+    This protocol ensures all skills follow the same pattern for
+    obtaining and validating fresh web data.
+
+    Returns:
+        Dict with the complete data freshness protocol
+    """
+    return DATA_FRESHNESS_PROTOCOL
 
 
 # ============================================================================
 # MCP Protocol Implementation
 # ============================================================================
 
-def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Handle incoming MCP request."""
-    method = request.get("method", "")
-    req_id = request.get("id")
-    params = request.get("params", {})
+def _loads(data: Any) -> Any:
+    """Parse a JSON-RPC message."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {}
-                },
-                "serverInfo": {
-                    "name": "intelligent-web-research",
-                    "version": "1.0.0"
-                }
-            }
-        }
 
-    elif method == "tools/list":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "tools": [
-                    {
-                        "name": "detect_capabilities",
-                        "description": """Detect available web search and browsing capabilities.
+def _dumps(obj: Any) -> str:
+    """Serialize a JSON-RPC message compactly."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize a value compactly to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _dumps_result(result: Any) -> str:
+    """Serialize a tool result for the text content block."""
+    if PRETTY_JSON:
+        return json.dumps(result, indent=2)
+    return _dumps(result)
+
+TOOLS = [
+    {
+        "name": "detect_capabilities",
+        "description": """Detect available web search and browsing capabilities.
 
 Use this FIRST to understand what tools are available:
 - Built-in WebSearch/WebFetch
 - Browsers (Comet, Chrome, Safari, Firefox, Arc)
 - CLI tools (curl, wget)
 
-Returns recommended method based on availability.""",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    {
-                        "name": "open_research_browser",
-                        "description": """Open an AI-powered search engine for comprehensive research.
+Returns recommended method based on availability.
+Results are cached for a few minutes; pass refresh=true to re-scan.""",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Re-scan instead of using cached results",
+                    "default": False
+                }
+            }
+        }
+    },
+    {
+        "name": "open_research_browser",
+        "description": """Open an AI-powered search engine for comprehensive research.
 
 Use this when:
 - Built-in WebSearch needs more comprehensive results
@@ -548,29 +815,29 @@ The browser opens with the search query, allowing the user to:
 1. Review AI-synthesized answers
 2. Explore cited sources
 3. Follow up with related questions""",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {
-                                    "type": "string",
-                                    "description": "Search query or research question"
-                                },
-                                "search_engine": {
-                                    "type": "string",
-                                    "description": "Search engine: perplexity (default), chatgpt, google, duckduckgo, bing, you",
-                                    "default": "perplexity"
-                                },
-                                "topic_domain": {
-                                    "type": "string",
-                                    "description": "Optional domain hint: government, tech, academic, news, business"
-                                }
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    {
-                        "name": "get_search_strategy",
-                        "description": """Get recommended search strategy for a query.
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query or research question"
+                },
+                "search_engine": {
+                    "type": "string",
+                    "description": "Search engine: perplexity (default), chatgpt, google, duckduckgo, bing, you",
+                    "default": "perplexity"
+                },
+                "topic_domain": {
+                    "type": "string",
+                    "description": "Optional domain hint: government, tech, academic, news, business"
+                }
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "get_search_strategy",
+        "description": """Get recommended search strategy for a query.
 
 Analyzes your query and returns the optimal approach:
 - Which tools to use (WebSearch, WebFetch, browser)
@@ -580,30 +847,68 @@ Analyzes your query and returns the optimal approach:
 - Step-by-step instructions
 
 Use this when planning a research task to get the best approach.""",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {
-                                    "type": "string",
-                                    "description": "The search query or research question"
-                                },
-                                "purpose": {
-                                    "type": "string",
-                                    "description": "Purpose: general, validation, deep_research, fact_check",
-                                    "default": "general"
-                                },
-                                "freshness": {
-                                    "type": "string",
-                                    "description": "Data freshness: any, recent, today",
-                                    "default": "any"
-                                }
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    {
-                        "name": "get_data_freshness_protocol",
-                        "description": """Get the Data Freshness Protocol for consistent web search usage.
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The search query or research question"
+                },
+                "purpose": {
+                    "type": "string",
+                    "description": "Purpose: general, validation, deep_research, fact_check",
+                    "default": "general"
+                },
+                "freshness": {
+                    "type": "string",
+                    "description": "Data freshness: any, recent, today",
+                    "default": "any"
+                }
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "research_session_start",
+        "description": """Start a research session in a single call.
+
+Opens the AI search engine in the browser (like open_research_browser) AND
+returns the recommended search strategy (like get_search_strategy).
+
+Use this at the start of a research task instead of calling both tools.""",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query or research question"
+                },
+                "search_engine": {
+                    "type": "string",
+                    "description": "Search engine: perplexity (default), chatgpt, google, duckduckgo, bing, you",
+                    "default": "perplexity"
+                },
+                "purpose": {
+                    "type": "string",
+                    "description": "Purpose: general, validation, deep_research, fact_check",
+                    "default": "general"
+                },
+                "freshness": {
+                    "type": "string",
+                    "description": "Data freshness: any, recent, today",
+                    "default": "any"
+                },
+                "topic_domain": {
+                    "type": "string",
+                    "description": "Optional domain hint: government, tech, academic, news, business"
+                }
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "get_data_freshness_protocol",
+        "description": """Get the Data Freshness Protocol for consistent web search usage.
 
 Returns the complete protocol that all skills should follow:
 - Search hierarchy (WebSearch → WebFetch → Browser → Training)
@@ -613,106 +918,209 @@ Returns the complete protocol that all skills should follow:
 - Output format ([VERIFIED], [UNVERIFIED], [STALE])
 
 Use this to ensure consistent data quality across all research tasks.""",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    {
-                        "name": "open_url",
-                        "description": """Open a specific URL in the browser.
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "open_url",
+        "description": """Open a specific URL in the browser.
 
 Use this to open specific websites for research or reference.
 Prefers Comet browser if available (AI-powered features).""",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "url": {
-                                    "type": "string",
-                                    "description": "URL to open"
-                                },
-                                "browser": {
-                                    "type": "string",
-                                    "description": "Browser: default, comet, chrome, safari, firefox",
-                                    "default": "default"
-                                }
-                            },
-                            "required": ["url"]
-                        }
-                    }
-                ]
-            }
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to open"
+                },
+                "browser": {
+                    "type": "string",
+                    "description": "Browser: default, comet, chrome, safari, firefox",
+                    "default": "default"
+                }
+            },
+            "required": ["url"]
         }
+    }
+]
+
+
+TOOL_HANDLERS = {
+    "detect_capabilities": lambda arguments: detect_capabilities(
+        refresh=arguments.get("refresh", False),
+    ),
+    "open_research_browser": lambda arguments: open_research_browser(
+        query=arguments.get("query", ""),
+        search_engine=arguments.get("search_engine", "perplexity"),
+        topic_domain=arguments.get("topic_domain"),
+    ),
+    "get_search_strategy": lambda arguments: get_search_strategy(
+        query=arguments.get("query", ""),
+        purpose=arguments.get("purpose", "general"),
+        freshness=arguments.get("freshness", "any"),
+    ),
+    "get_data_freshness_protocol": lambda arguments: get_data_freshness_protocol(),
+    "research_session_start": lambda arguments: research_session_start(
+        query=arguments.get("query", ""),
+        search_engine=arguments.get("search_engine", "perplexity"),
+        purpose=arguments.get("purpose", "general"),
+        freshness=arguments.get("freshness", "any"),
+        topic_domain=arguments.get("topic_domain"),
+    ),
+    "open_url": lambda arguments: open_browser(
+        url=arguments.get("url", ""),
+        browser=arguments.get("browser", "default"),
+    ),
+}
 
-    elif method == "tools/call":
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-
-        if tool_name == "detect_capabilities":
-            result = detect_capabilities()
-        elif tool_name == "open_research_browser":
-            result = open_research_browser(
-                query=arguments.get("query", ""),
-                search_engine=arguments.get("search_engine", "perplexity"),
-                topic_domain=arguments.get("topic_domain"),
-            )
-        elif tool_name == "get_search_strategy":
-            result = get_search_strategy(
-                query=arguments.get("query", ""),
-                purpose=arguments.get("purpose", "general"),
-                freshness=arguments.get("freshness", "any"),
-            )
-        elif tool_name == "get_data_freshness_protocol":
-            result = get_data_freshness_protocol()
-        elif tool_name == "open_url":
-            result = open_browser(
-                url=arguments.get("url", ""),
-                browser=arguments.get("browser", "default"),
-            )
-        else:
-            result = {"error": f"Unknown tool: {tool_name}"}
 
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(result, indent=2)
-                    }
-                ]
+def _handle_initialize(req_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "result": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {}
+            },
+            "serverInfo": {
+                "name": "intelligent-web-research",
+                "version": "1.0.0"
             }
         }
+    }
+
+
+def _handle_tools_list(req_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "result": {"tools": TOOLS}
+    }
+
 
-    elif method == "notifications/initialized":
-        return None  # No response needed for notifications
+# tools/call envelope; only the id and the (already JSON) text vary
+TOOL_RESPONSE_TEMPLATE = b'{"jsonrpc":"2.0","id":%s,"result":{"content":[{"type":"text","text":%s}]}}'
 
+
+def _handle_tools_call(req_id: Any, params: Dict[str, Any]) -> bytes:
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
+
+    handler = TOOL_HANDLERS.get(tool_name)
+    if handler is not None:
+        result = handler(arguments)
     else:
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "error": {
-                "code": -32601,
-                "message": f"Method not found: {method}"
-            }
+        result = {"error": f"Unknown tool: {tool_name}"}
+
+    # Filled in directly rather than building the envelope dict and
+    # serializing it again around the result text
+    return TOOL_RESPONSE_TEMPLATE % (_dumps_bytes(req_id), _dumps_bytes(_dumps_result(result)))
+
+
+def _handle_notification(req_id: Any, params: Dict[str, Any]) -> None:
+    return None  # No response needed for notifications
+
+
+METHOD_HANDLERS = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "notifications/initialized": _handle_notification,
+}
+
+
+def handle_request(request: Dict[str, Any]) -> Optional[Union[Dict[str, Any], bytes]]:
+    """Handle incoming MCP request.
+
+    Returns the response message, None for notifications, or (for tools/call)
+    the response already serialized to JSON bytes.
+    """
+    method = request.get("method", "")
+    req_id = request.get("id")
+    params = request.get("params", {})
+
+    handler = METHOD_HANDLERS.get(method)
+    if handler is not None:
+        return handler(req_id, params)
+
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "error": {
+            "code": -32601,
+            "message": f"Method not found: {method}"
         }
+    }
+
+
+def _encode_message(message: Union[Dict[str, Any], bytes], framed: bool = False) -> bytes:
+    """Serialize a JSON-RPC message for stdout.
+
+    Newline-delimited by default; with framed=True it gets a Content-Length
+    header instead. Pre-serialized bytes are passed through as the body.
+    """
+    if framed:
+        body = message if isinstance(message, bytes) else _dumps_bytes(message)
+        return b"Content-Length: %d\r\n\r\n" % len(body) + body
+    if isinstance(message, bytes):
+        return message + b"\n"
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(message) + "\n").encode()
+
+
+def _read_framed_message(stdin: Any, first_line: Optional[bytes] = None) -> Optional[bytes]:
+    """Read one Content-Length framed message body; None at EOF."""
+    line = first_line if first_line is not None else stdin.readline()
+    length = None
+    while line and line.strip():
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+        line = stdin.readline()
+    if not line:
+        return None
+    if length is None:
+        return b""  # headers without a length - skipped as malformed
+    return stdin.read(length)
 
 
 def main():
-    """Main MCP server loop using stdio."""
+    """Main MCP server loop using stdio.
+
+    Works on the binary streams directly: no text-layer decode on input and
+    one buffered write plus flush per response. Messages are newline-delimited
+    JSON unless the first message arrives with a Content-Length header, in
+    which case that framing is used for the whole session and bodies are read
+    by exact length.
+    """
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+
+    pending = stdin.readline()
+    framed = pending.lower().startswith(b"content-length:")
+
     while True:
         try:
-            line = sys.stdin.readline()
-            if not line:
+            line, pending = pending, None
+            if framed:
+                data = _read_framed_message(stdin, line)
+            else:
+                data = line if line is not None else stdin.readline()
+                data = data or None
+            if data is None:
                 break
 
-            request = json.loads(line)
+            request = _loads(data)
             response = handle_request(request)
 
             if response:
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
+                stdout.write(_encode_message(response, framed))
+                stdout.flush()
 
         except json.JSONDecodeError:
             continue
@@ -725,8 +1133,8 @@ def main():
                     "message": str(e)
                 }
             }
-            sys.stdout.write(json.dumps(error_response) + "\n")
-            sys.stdout.flush()
+            stdout.write(_encode_message(error_response, framed))
+            stdout.flush()
 
 
 if __name__ == "__main__":
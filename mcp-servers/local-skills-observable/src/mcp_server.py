@@ -20,21 +20,33 @@ MANDATORY: All agents MUST call `route_prompt` before processing any request.
 """
 
 import asyncio
+import atexit
+import contextlib
+import ctypes
 import json
 import os
 import sys
 import subprocess
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 import hashlib
-import uuid
+import importlib.util
+import io
+import itertools
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to the path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 try:
+    import anyio
     from mcp.server import Server
     from mcp.server.stdio import stdio_server
     from mcp.types import Tool, TextContent
@@ -61,30 +73,425 @@ except ImportError:
         def call_tool(self):
             return lambda f: f
 
+# Optional: orjson serializes event batches in C, straight to bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: uvloop runs the asyncio loop on libuv (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = hasattr(uvloop, "run")  # uvloop.run() needs uvloop>=0.18
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Observability constants
 STREAM_DIR = Path("/tmp/claude-boost/observability")
 EVENTS_FILE = STREAM_DIR / "events.jsonl"
 
 
-def emit_event(event_type: str, skill: str, **kwargs) -> None:
+# Event writer tuning: a batch is flushed once it holds EVENT_BATCH_SIZE events
+# or EVENT_FLUSH_INTERVAL seconds after its first event, whichever comes first.
+EVENT_QUEUE_SIZE = 10_000
+EVENT_BATCH_SIZE = 128
+EVENT_FLUSH_INTERVAL = 0.05
+EVENT_HEALTH_INTERVAL = 10  # Min seconds between HEALTH events reporting drops
+EVENT_SHARDS_OPEN_MAX = 7  # Day-sharded files kept open at once
+
+
+# Gathered writes: one writev() per batch straight from the per-event buffers
+HAS_WRITEV = hasattr(os, "writev")
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+
+# Disk blocks reserved ahead of the end of events.jsonl so small appends don't
+# each trigger filesystem extent allocation (Linux only)
+EVENTS_PREALLOCATE_BYTES = 1024 * 1024
+FALLOC_FL_KEEP_SIZE = 0x01
+
+
+def _load_fallocate() -> Optional[Callable[..., int]]:
+    """Return libc's fallocate() if this platform has it."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fallocate = getattr(libc, "fallocate64", None) or libc.fallocate
+    except (OSError, AttributeError):
+        return None
+    fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    fallocate.restype = ctypes.c_int
+    return fallocate
+
+
+_fallocate = _load_fallocate()
+
+
+def _writev_all(fd: int, records: List[bytes]) -> None:
+    """Append records to fd with as few writev() calls as IOV_MAX allows."""
+    for start in range(0, len(records), IOV_MAX):
+        group = records[start:start + IOV_MAX]
+        written = os.writev(fd, group)
+        if written < sum(map(len, group)):
+            # Short write (e.g. disk nearly full): finish the rest with write()
+            rest = memoryview(b"".join(group))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+
+
+@dataclass(slots=True)
+class Event:
+    """One observability event; unset (None) fields are left out of the JSON."""
+    event_id: str
+    timestamp: str
+    event_type: str
+    skill: str
+    category: str = "mcp-skill-retrieval"
+    status: str = "running"
+    execution_id: Optional[str] = None
+    duration_ms: Optional[int] = None
+    error: Optional[str] = None
+    tokens: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            name: value
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
+
+
+class _EventFile:
+    """An append-only events file kept open, with its preallocation window."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.fh: BinaryIO = open(path, "ab", buffering=0)
+        self._size = self._reserved = os.fstat(self.fh.fileno()).st_size
+
+    def append(self, records: List[bytes]) -> None:
+        size = sum(map(len, records))
+        self._reserve(size)
+        self._size += size
+        if HAS_WRITEV:
+            _writev_all(self.fh.fileno(), records)
+        else:
+            # Unbuffered: exactly one write() syscall per batch
+            self.fh.write(b"".join(records))
+
+    def close(self) -> None:
+        if self._reserved > self._size:
+            # Give back the unused reservation; KEEP_SIZE blocks otherwise stay
+            # allocated past EOF for as long as the file exists
+            fd = self.fh.fileno()
+            try:
+                os.ftruncate(fd, os.fstat(fd).st_size)
+            except OSError:
+                pass
+        self.fh.close()
+
+    def _reserve(self, incoming: int) -> None:
+        if _fallocate is None or self._size + incoming <= self._reserved:
+            return
+        # KEEP_SIZE allocates blocks past EOF without changing the file's
+        # visible size, so readers never see padding. Failure (unsupported
+        # on e.g. some network filesystems) is harmless; either way, don't
+        # try again until writes pass this window.
+        start = self._size
+        length = max(EVENTS_PREALLOCATE_BYTES, incoming)
+        _fallocate(self.fh.fileno(), FALLOC_FL_KEEP_SIZE, start, length)
+        self._reserved = start + length
+
+
+class EventWriter:
+    """
+    Batches observability events onto a single long-lived writer task.
+
+    While the writer is running, events are queued without blocking and
+    written in batches. Before start() (or in standalone mode) events are
+    appended synchronously. Both paths share lazily opened, unbuffered file
+    handles that stay open until exit.
+
+    With shard_by_day, events go to one file per UTC day
+    (events-YYYYMMDD.jsonl) instead of a single ever-growing events.jsonl.
+    """
+
+    def __init__(self, path: Path, shard_by_day: bool = False):
+        self.path = path
+        self.shard_by_day = shard_by_day
+        self.dropped = 0
+        self._dropped_reported = 0
+        self._health_at = 0.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._files: "OrderedDict[Path, _EventFile]" = OrderedDict()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def start(self) -> None:
+        """Open the events file and start the writer task on the running loop."""
+        if self._task is not None:
+            return
+        with self._lock:
+            self._file(self._path_for(datetime.now(timezone.utc).isoformat()))
+        self._queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the writer task and flush anything still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.flush()
+        self._queue = None
+        self._health_at = 0.0  # Report any outstanding drops on the way out
+        health = self._health_event()
+        if health is not None:
+            self._write([health])
+
+    def put(self, event: Event) -> None:
+        """Queue an event; drops (and counts) it if the queue is full."""
+        if self._queue is None:
+            self._write([event])
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Synchronously write out whatever is still queued."""
+        if self._queue is None:
+            return
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            self._write(batch)
+
+    def close(self) -> None:
+        """Flush queued events and close the file handles."""
+        self.flush()
+        with self._lock:
+            for events_file in self._files.values():
+                events_file.close()
+            self._files.clear()
+
+    def _path_for(self, timestamp: str) -> Path:
+        if not self.shard_by_day:
+            return self.path
+        # ISO timestamps start with YYYY-MM-DD
+        day = timestamp[:10].replace("-", "")
+        return self.path.with_name(f"{self.path.stem}-{day}{self.path.suffix}")
+
+    def _file(self, path: Path) -> _EventFile:
+        # Caller holds self._lock
+        events_file = self._files.get(path)
+        if events_file is None:
+            events_file = self._files[path] = _EventFile(path)
+            if len(self._files) > EVENT_SHARDS_OPEN_MAX:
+                self._files.popitem(last=False)[1].close()
+        else:
+            self._files.move_to_end(path)
+        return events_file
+
+    def _write(self, batch: List[Event]) -> None:
+        # Group records per file so each file gets one write per batch
+        by_path: Dict[Path, List[bytes]] = {}
+        for event in batch:
+            if ORJSON_AVAILABLE:
+                record = orjson.dumps(event.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                record = (json.dumps(event.to_dict()) + "\n").encode("utf-8")
+            by_path.setdefault(self._path_for(event.timestamp), []).append(record)
+        with self._lock:
+            for path, records in by_path.items():
+                self._file(path).append(records)
+
+    def _health_event(self) -> Optional[Event]:
+        """A HEALTH event if events were dropped since the last report."""
+        dropped = self.dropped - self._dropped_reported
+        now = time.monotonic()
+        if not dropped or now - self._health_at < EVENT_HEALTH_INTERVAL:
+            return None
+        self._dropped_reported = self.dropped
+        self._health_at = now
+        return Event(
+            event_id=secrets.token_hex(4),
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            event_type="HEALTH",
+            skill="event-writer",
+            status="degraded",
+            context={"dropped_events": dropped, "dropped_total": self.dropped}
+        )
+
+    def _drain_into(self, batch: List[Event]) -> None:
+        while len(batch) < EVENT_BATCH_SIZE and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[Event] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                self._drain_into(batch)
+                if len(batch) < EVENT_BATCH_SIZE:
+                    # Give the rest of the burst a chance to arrive
+                    await asyncio.sleep(EVENT_FLUSH_INTERVAL)
+                    self._drain_into(batch)
+                health = self._health_event()
+                if health is not None:
+                    batch.append(health)
+                pending, batch = batch, []
+                await loop.run_in_executor(None, self._write, pending)
+        except asyncio.CancelledError:
+            # Don't lose a batch that was collected but not yet handed off.
+            if batch:
+                self._write(batch)
+            raise
+
+
+event_writer = EventWriter(
+    EVENTS_FILE,
+    shard_by_day=os.environ.get("OBSERVABILITY_SHARD_BY_DAY", "").lower() in ("1", "true", "yes")
+)
+
+# UPO router script; imported in-process when it exposes route(prompt) -> dict
+UPO_MAIN_PATH = PROJECT_ROOT / "skills" / "universal-prompt-orchestrator" / "scripts" / "main.py"
+UPO_TIMEOUT = 60  # Increased from 30s to handle file loading on slower systems
+UPO_CACHE_MAX = 512  # Routing is deterministic, so results are memoized per prompt
+# ...but results also report context status (e.g. whether a Notion fetch is
+# needed), which depends on state outside main.py, so entries expire
+UPO_CACHE_TTL = 300
+
+# SKILL.md contents kept in memory, revalidated against the file's mtime
+SKILL_CACHE_MAX = 128
+SKILL_INDEX_TTL = 30  # Seconds before the skills directory is rescanned
+
+
+# Execution ids only need to be unique within this process's events; a counter
+# from a random start keeps them 8 hex chars without a uuid4 per tool call
+_execution_ids = itertools.count(secrets.randbits(32))
+
+
+def _new_execution_id() -> str:
+    return f"{next(_execution_ids) & 0xFFFFFFFF:08x}"
+
+
+def emit_event(
+    event_type: str,
+    skill: str,
+    status: str = "running",
+    execution_id: Optional[str] = None,
+    duration_ms: Optional[int] = None,
+    error: Optional[str] = None,
+    tokens: Optional[Dict[str, Any]] = None,
+    context: Optional[Dict[str, Any]] = None
+) -> None:
     """Emit an observability event to the streaming file."""
-    STREAM_DIR.mkdir(parents=True, exist_ok=True)
+    event_writer.put(Event(
+        event_id=secrets.token_hex(4),
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        event_type=event_type,
+        skill=skill,
+        status=status,
+        execution_id=execution_id,
+        duration_ms=duration_ms,
+        error=error,
+        tokens=tokens,
+        context=context
+    ))
+
+
+def _upo_mtime_ns() -> int:
+    try:
+        return UPO_MAIN_PATH.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_upo_route() -> Optional[Callable[[str], Dict[str, Any]]]:
+    """Import UPO's main.py and return its route() function, if any."""
+    if not UPO_MAIN_PATH.exists():
+        return None
+    
+    scripts_dir = str(UPO_MAIN_PATH.parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    
+    spec = importlib.util.spec_from_file_location("upo_main", UPO_MAIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        # stdout carries JSON-RPC; keep any import-time output off it
+        with contextlib.redirect_stdout(sys.stderr):
+            spec.loader.exec_module(module)
+    except Exception as e:
+        print(f"Warning: could not import UPO in-process ({e}); using subprocess", file=sys.stderr)
+        return None
+    
+    route = getattr(module, "route", None)
+    return route if callable(route) else None
+
+
+# Fixed parts of the route_prompt output
+UPO_SEPARATOR = "=" * 60
+UPO_HEADER = f"{UPO_SEPARATOR}\nUPO ROUTING RESULT (DETERMINISTIC)\n{UPO_SEPARATOR}\n"
+DEFAULT_EXECUTION_GUIDANCE = "Execute with balanced consideration"
+
+
+def _format_upo_result(upo_result: Dict[str, Any]) -> str:
+    """Render a UPO routing result as the text returned to the agent."""
+    context_status = upo_result.get("context_status", {})
+    keywords = upo_result.get("matched_keywords", [])
+    
+    output_lines = [
+        UPO_HEADER,
+        f"Context Status: {context_status.get('status', 'UNKNOWN')}",
+        f"Needs Notion Fetch: {context_status.get('needs_notion_fetch', False)}",
+        "",
+    ]
     
-    event = {
-        "event_id": str(uuid.uuid4())[:8],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "event_type": event_type,
-        "skill": skill,
-        "category": "mcp-skill-retrieval",
-        "status": kwargs.get("status", "running"),
-        **kwargs
-    }
+    # Add Notion commands if needed
+    notion_cmds = upo_result.get("notion_fetch_commands", [])
+    if notion_cmds:
+        output_lines.append("--- NOTION COMMANDS TO EXECUTE ---")
+        output_lines.extend(f"  {cmd}" for cmd in notion_cmds)
+        output_lines.append("")
     
-    # Remove None values
-    event = {k: v for k, v in event.items() if v is not None}
+    output_lines += [
+        f"Matched Keywords: {', '.join(keywords) if keywords else 'None'}",
+        "",
+        "--- SELECTED SKILLS (Use these) ---",
+    ]
+    output_lines.extend(
+        f"  [{skill.get('match_type', 'unknown').upper()}] {skill.get('skill_name', '?')} <- {', '.join(skill.get('matched_keywords', []))}"
+        for skill in upo_result.get("selected_skills", [])[:10]
+    )
+    output_lines += ["", "--- SELECTED AGENTS ---"]
+    output_lines.extend(
+        f"  [{agent.get('weight', 0)}%] {agent.get('agent_id', '?')}{' (MANDATORY)' if agent.get('is_mandatory') else ''}"
+        for agent in upo_result.get("selected_agents", [])
+    )
+    output_lines += [
+        "",
+        f"Execution Guidance: {upo_result.get('execution_guidance', DEFAULT_EXECUTION_GUIDANCE)}",
+        "",
+    ]
     
-    with open(EVENTS_FILE, "a") as f:
-        f.write(json.dumps(event) + "\n")
+    return "\n".join(output_lines)
 
 
 class SkillsServer:
@@ -96,6 +503,15 @@ class SkillsServer:
             os.path.expanduser("~/.claude/skills")
         ))
         self.server = Server("local-skills-observable")
+        self._upo_mtime_ns = _upo_mtime_ns()
+        self._upo_route = _load_upo_route()
+        # One thread of its own, so a hung route() can't tie up the default
+        # executor (which the event writer uses)
+        self._upo_executor = ThreadPoolExecutor(max_workers=1)
+        self._upo_cache: "OrderedDict[str, Tuple[float, Dict[str, Any], str]]" = OrderedDict()
+        self._skill_index: Dict[str, Path] = {}
+        self._skill_index_at: Optional[float] = None
+        self._content_cache: "OrderedDict[str, Tuple[int, str, str, int]]" = OrderedDict()
         self._setup_handlers()
         
     def _setup_handlers(self):
@@ -158,8 +574,8 @@ class SkillsServer:
         Route a prompt through UPO router (DETERMINISTIC).
         This is the MANDATORY first call for all agents.
         """
-        execution_id = str(uuid.uuid4())[:8]
-        start_time = datetime.now(timezone.utc)
+        execution_id = _new_execution_id()
+        start_ns = time.monotonic_ns()
         
         # Emit start event
         emit_event(
@@ -174,58 +590,59 @@ class SkillsServer:
         )
         
         try:
-            # Run UPO skill directly (self-contained, no wrapper needed)
-            upo_main_path = PROJECT_ROOT / "skills" / "universal-prompt-orchestrator" / "scripts" / "main.py"
-
-            if not upo_main_path.exists():
-                raise FileNotFoundError(f"UPO main.py not found at {upo_main_path}")
+            mtime_ns = _upo_mtime_ns()
+            if mtime_ns != self._upo_mtime_ns:
+                # main.py was edited: drop results from the old version and
+                # re-import it, or in-process calls would keep running it
+                self._upo_cache.clear()
+                if self._upo_route is not None:
+                    self._upo_route = _load_upo_route()
+                self._upo_mtime_ns = mtime_ns
             
-            # Execute UPO router with --json flag
-            # Use sys.executable for cross-platform compatibility (Windows uses 'python', not 'python3')
-            try:
-                result = subprocess.run(
-                    [sys.executable, str(upo_main_path), "--json", prompt],
-                    capture_output=True,
-                    text=True,
-                    timeout=60,  # Increased from 30s to handle file loading on slower systems
-                    cwd=str(PROJECT_ROOT)  # Set working directory to project root
-                )
-            except subprocess.TimeoutExpired:
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+            cached = self._upo_cache.get(cache_key)
+            if cached is not None and cached[0] <= time.monotonic():
+                del self._upo_cache[cache_key]
+                cached = None
+            if cached is not None:
+                _, upo_result, text = cached
+                self._upo_cache.move_to_end(cache_key)
                 emit_event(
-                    event_type="UPO_ROUTE_END",
+                    event_type="UPO_ROUTE_CACHE_HIT",
                     skill="upo-router",
                     execution_id=execution_id,
-                    status="error",
-                    duration_ms=self._calc_duration(start_time),
-                    context={"error": "Timeout after 60s"}
+                    status="success"
                 )
-                raise RuntimeError("UPO router timed out after 60 seconds. Check if files are loading correctly.")
-            
-            if result.returncode != 0:
-                error_msg = result.stderr or result.stdout or "Unknown error"
-                emit_event(
-                    event_type="UPO_ROUTE_END",
-                    skill="upo-router",
-                    execution_id=execution_id,
-                    status="error",
-                    duration_ms=self._calc_duration(start_time),
-                    context={"error": error_msg[:500]}  # Truncate long errors
-                )
-                raise RuntimeError(f"UPO router failed (exit {result.returncode}): {error_msg}")
+            elif self._upo_route is not None:
+                # In-process: no fork/exec, interpreter startup or JSON round-trip
+                loop = asyncio.get_running_loop()
+                try:
+                    upo_result = await asyncio.wait_for(
+                        loop.run_in_executor(self._upo_executor, self._upo_route, prompt),
+                        timeout=UPO_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    # The thread can't be killed; route later prompts through
+                    # the subprocess, whose timeout does kill it
+                    self._upo_route = None
+                    emit_event(
+                        event_type="UPO_ROUTE_END",
+                        skill="upo-router",
+                        execution_id=execution_id,
+                        status="error",
+                        duration_ms=self._calc_duration(start_ns),
+                        context={"error": f"Timeout after {UPO_TIMEOUT}s"}
+                    )
+                    raise RuntimeError(f"UPO router timed out after {UPO_TIMEOUT} seconds. Check if files are loading correctly.")
+            else:
+                upo_result = self._run_upo_subprocess(prompt, execution_id, start_ns)
             
-            # Parse JSON output
-            try:
-                upo_result = json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                emit_event(
-                    event_type="UPO_ROUTE_END",
-                    skill="upo-router",
-                    execution_id=execution_id,
-                    status="error",
-                    duration_ms=self._calc_duration(start_time),
-                    context={"error": f"JSON parse error: {str(e)}", "output_preview": result.stdout[:200]}
-                )
-                raise RuntimeError(f"UPO router returned invalid JSON: {str(e)}\nOutput: {result.stdout[:500]}")
+            if cached is None:
+                # Format output for the agent once per distinct routing result
+                text = _format_upo_result(upo_result)
+                self._upo_cache[cache_key] = (time.monotonic() + UPO_CACHE_TTL, upo_result, text)
+                if len(self._upo_cache) > UPO_CACHE_MAX:
+                    self._upo_cache.popitem(last=False)
             
             # Emit success event
             emit_event(
@@ -233,7 +650,7 @@ class SkillsServer:
                 skill="upo-router",
                 execution_id=execution_id,
                 status="success",
-                duration_ms=self._calc_duration(start_time),
+                duration_ms=self._calc_duration(start_ns),
                 context={
                     "matched_keywords": upo_result.get("matched_keywords", []),
                     "skills_count": len(upo_result.get("selected_skills", [])),
@@ -242,48 +659,7 @@ class SkillsServer:
                 }
             )
             
-            # Format output for the agent
-            output_lines = [
-                "=" * 60,
-                "UPO ROUTING RESULT (DETERMINISTIC)",
-                "=" * 60,
-                "",
-                f"Context Status: {upo_result.get('context_status', {}).get('status', 'UNKNOWN')}",
-                f"Needs Notion Fetch: {upo_result.get('context_status', {}).get('needs_notion_fetch', False)}",
-                "",
-            ]
-            
-            # Add Notion commands if needed
-            notion_cmds = upo_result.get("notion_fetch_commands", [])
-            if notion_cmds:
-                output_lines.append("--- NOTION COMMANDS TO EXECUTE ---")
-                for cmd in notion_cmds:
-                    output_lines.append(f"  {cmd}")
-                output_lines.append("")
-            
-            # Add matched keywords
-            keywords = upo_result.get("matched_keywords", [])
-            output_lines.append(f"Matched Keywords: {', '.join(keywords) if keywords else 'None'}")
-            output_lines.append("")
-            
-            # Add selected skills
-            output_lines.append("--- SELECTED SKILLS (Use these) ---")
-            for skill in upo_result.get("selected_skills", [])[:10]:
-                output_lines.append(f"  [{skill.get('match_type', 'unknown').upper()}] {skill.get('skill_name', '?')} <- {', '.join(skill.get('matched_keywords', []))}")
-            output_lines.append("")
-            
-            # Add selected agents
-            output_lines.append("--- SELECTED AGENTS ---")
-            for agent in upo_result.get("selected_agents", []):
-                mandatory = " (MANDATORY)" if agent.get("is_mandatory") else ""
-                output_lines.append(f"  [{agent.get('weight', 0)}%] {agent.get('agent_id', '?')}{mandatory}")
-            output_lines.append("")
-            
-            # Add guidance
-            output_lines.append(f"Execution Guidance: {upo_result.get('execution_guidance', 'Execute with balanced consideration')}")
-            output_lines.append("")
-            
-            return [TextContent(type="text", text="\n".join(output_lines))]
+            return [TextContent(type="text", text=text)]
             
         except subprocess.TimeoutExpired:
             emit_event(
@@ -292,7 +668,7 @@ class SkillsServer:
                 execution_id=execution_id,
                 status="failed",
                 error="UPO router timed out",
-                duration_ms=self._calc_duration(start_time)
+                duration_ms=self._calc_duration(start_ns)
             )
             return [TextContent(type="text", text="Error: UPO router timed out")]
             
@@ -303,15 +679,70 @@ class SkillsServer:
                 execution_id=execution_id,
                 status="failed",
                 error=str(e),
-                duration_ms=self._calc_duration(start_time)
+                duration_ms=self._calc_duration(start_ns)
             )
             return [TextContent(type="text", text=f"Error: {str(e)}")]
     
+    def _run_upo_subprocess(self, prompt: str, execution_id: str, start_ns: int) -> Dict[str, Any]:
+        """Run UPO's main.py as a child process (used when it can't be imported)."""
+        # Run UPO skill directly (self-contained, no wrapper needed)
+        if not UPO_MAIN_PATH.exists():
+            raise FileNotFoundError(f"UPO main.py not found at {UPO_MAIN_PATH}")
+        
+        # Execute UPO router with --json flag
+        # Use sys.executable for cross-platform compatibility (Windows uses 'python', not 'python3')
+        try:
+            result = subprocess.run(
+                [sys.executable, str(UPO_MAIN_PATH), "--json", prompt],
+                capture_output=True,
+                text=True,
+                timeout=UPO_TIMEOUT,
+                cwd=str(PROJECT_ROOT)  # Set working directory to project root
+            )
+        except subprocess.TimeoutExpired:
+            emit_event(
+                event_type="UPO_ROUTE_END",
+                skill="upo-router",
+                execution_id=execution_id,
+                status="error",
+                duration_ms=self._calc_duration(start_ns),
+                context={"error": f"Timeout after {UPO_TIMEOUT}s"}
+            )
+            raise RuntimeError(f"UPO router timed out after {UPO_TIMEOUT} seconds. Check if files are loading correctly.")
+
+        if result.returncode != 0:
+            error_msg = result.stderr or result.stdout or "Unknown error"
+            emit_event(
+                event_type="UPO_ROUTE_END",
+                skill="upo-router",
+                execution_id=execution_id,
+                status="error",
+                duration_ms=self._calc_duration(start_ns),
+                context={"error": error_msg[:500]}  # Truncate long errors
+            )
+            raise RuntimeError(f"UPO router failed (exit {result.returncode}): {error_msg}")
+
+        # Parse JSON output
+        try:
+            upo_result = json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            emit_event(
+                event_type="UPO_ROUTE_END",
+                skill="upo-router",
+                execution_id=execution_id,
+                status="error",
+                duration_ms=self._calc_duration(start_ns),
+                context={"error": f"JSON parse error: {str(e)}", "output_preview": result.stdout[:200]}
+            )
+            raise RuntimeError(f"UPO router returned invalid JSON: {str(e)}\nOutput: {result.stdout[:500]}")
+        
+        return upo_result
+    
     async def _get_skill(self, skill_name: str) -> List[TextContent]:
         """Retrieve a skill and emit observability events."""
         
-        execution_id = str(uuid.uuid4())[:8]
-        start_time = datetime.now(timezone.utc)
+        execution_id = _new_execution_id()
+        start_ns = time.monotonic_ns()
         
         # Emit start event
         emit_event(
@@ -337,13 +768,11 @@ class SkillsServer:
                     execution_id=execution_id,
                     status="failed",
                     error=f"Skill '{skill_name}' not found",
-                    duration_ms=self._calc_duration(start_time)
+                    duration_ms=self._calc_duration(start_ns)
                 )
                 return [TextContent(type="text", text=f"Error: Skill '{skill_name}' not found")]
             
-            # Read skill content (UTF-8 for cross-platform compatibility)
-            content = skill_path.read_text(encoding="utf-8")
-            content_hash = hashlib.md5(content.encode()).hexdigest()[:8]
+            content, content_hash, output_tokens = self._read_skill(skill_name, skill_path)
             
             # Emit success event with metrics
             emit_event(
@@ -351,11 +780,11 @@ class SkillsServer:
                 skill=skill_name,
                 execution_id=execution_id,
                 status="success",
-                duration_ms=self._calc_duration(start_time),
+                duration_ms=self._calc_duration(start_ns),
                 tokens={
                     "input_tokens": len(skill_name.split()),
-                    "output_tokens": len(content.split()),
-                    "total_tokens": len(content.split())
+                    "output_tokens": output_tokens,
+                    "total_tokens": output_tokens
                 },
                 context={
                     "skill_path": str(skill_path),
@@ -374,7 +803,7 @@ class SkillsServer:
                 execution_id=execution_id,
                 status="failed",
                 error=str(e),
-                duration_ms=self._calc_duration(start_time)
+                duration_ms=self._calc_duration(start_ns)
             )
             return [TextContent(type="text", text=f"Error: {str(e)}")]
     
@@ -388,14 +817,7 @@ class SkillsServer:
             context={"source": "mcp-local-skills-observable"}
         )
         
-        skills = []
-        
-        if self.skills_dir.exists():
-            for item in self.skills_dir.iterdir():
-                if item.is_dir():
-                    skill_file = item / "SKILL.md"
-                    if skill_file.exists():
-                        skills.append(item.name)
+        skills = list(self._refresh_skill_index())
         
         emit_event(
             event_type="SKILL_END",
@@ -407,16 +829,49 @@ class SkillsServer:
         result = "\n".join([f"- {s}" for s in sorted(skills)])
         return [TextContent(type="text", text=f"Available skills ({len(skills)}):\n{result}")]
     
-    def _find_skill_path(self, skill_name: str) -> Optional[Path]:
-        """Find the skill file path."""
-        # Try direct path
-        skill_dir = self.skills_dir / skill_name
-        if skill_dir.exists():
-            skill_file = skill_dir / "SKILL.md"
-            if skill_file.exists():
-                return skill_file
+    def _read_skill(self, skill_name: str, skill_path: Path) -> Tuple[str, str, int]:
+        """Return (content, content_hash, word_count), re-reading only when the file changed."""
+        try:
+            mtime_ns = skill_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Skill was moved or removed; rescan the directory next time
+            self._skill_index_at = None
+            self._content_cache.pop(skill_name, None)
+            raise
         
-        # Try with variations
+        cached = self._content_cache.get(skill_name)
+        if cached is not None and cached[0] == mtime_ns:
+            self._content_cache.move_to_end(skill_name)
+            return cached[1], cached[2], cached[3]
+        
+        # Hash the raw bytes, decoding (UTF-8 for cross-platform
+        # compatibility) only once for the returned text
+        raw = skill_path.read_bytes()
+        content_hash = hashlib.blake2b(raw, digest_size=4).hexdigest()
+        content = raw.decode("utf-8")
+        if "\r" in content:
+            # Match read_text()'s universal-newline translation
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        # Count on the text: bytes.split() only knows ASCII whitespace
+        word_count = len(content.split())
+        
+        self._content_cache[skill_name] = (mtime_ns, content, content_hash, word_count)
+        self._content_cache.move_to_end(skill_name)
+        if len(self._content_cache) > SKILL_CACHE_MAX:
+            self._content_cache.popitem(last=False)
+        return content, content_hash, word_count
+    
+    def _find_skill_path(self, skill_name: str) -> Optional[Path]:
+        """Find the skill file path via the skills directory index."""
+        skill_file = self._match_skill(self._get_skill_index(), skill_name)
+        if skill_file is None:
+            # May have been added since the last scan
+            skill_file = self._match_skill(self._refresh_skill_index(), skill_name)
+        return skill_file
+    
+    @staticmethod
+    def _match_skill(index: Dict[str, Path], skill_name: str) -> Optional[Path]:
+        """Look up skill_name, then its variations, in a directory index."""
         variations = [
             skill_name,
             skill_name.replace("-", "_"),
@@ -425,26 +880,64 @@ class SkillsServer:
         ]
         
         for var in variations:
-            skill_dir = self.skills_dir / var
-            if skill_dir.exists():
-                skill_file = skill_dir / "SKILL.md"
-                if skill_file.exists():
-                    return skill_file
+            skill_file = index.get(var)
+            if skill_file is not None:
+                return skill_file
         
         return None
     
-    def _calc_duration(self, start_time: datetime) -> int:
+    def _get_skill_index(self) -> Dict[str, Path]:
+        """Return the skill index, rescanning once it is SKILL_INDEX_TTL old."""
+        if self._skill_index_at is None or time.monotonic() - self._skill_index_at > SKILL_INDEX_TTL:
+            return self._refresh_skill_index()
+        return self._skill_index
+    
+    def _refresh_skill_index(self) -> Dict[str, Path]:
+        """Scan skills_dir once, mapping each skill directory name to its SKILL.md."""
+        index: Dict[str, Path] = {}
+        
+        if self.skills_dir.exists():
+            with os.scandir(self.skills_dir) as entries:
+                for entry in entries:
+                    # is_dir() answers from the dirent type; only symlinks need a stat
+                    if entry.is_dir():
+                        skill_file = os.path.join(entry.path, "SKILL.md")
+                        if os.path.isfile(skill_file):
+                            index[entry.name] = Path(skill_file)
+        
+        self._skill_index = index
+        self._skill_index_at = time.monotonic()
+        return index
+    
+    def _calc_duration(self, start_ns: int) -> int:
         """Calculate duration in milliseconds."""
-        return int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+        return (time.monotonic_ns() - start_ns) // 1_000_000
     
     async def run(self):
         """Run the MCP server."""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        event_writer.start()
+        try:
+            async with stdio_server(stdout=_protocol_stdout()) as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            await event_writer.stop()
+
+
+def _protocol_stdout() -> "anyio.AsyncFile[str]":
+    """Give JSON-RPC a private copy of fd 1 and point fd 1 at stderr.
+
+    In-process UPO routing runs on a worker thread, where redirecting
+    sys.stdout isn't safe (it's process-wide); moving the descriptor instead
+    sends anything printed to stdout, from any thread or C code, to stderr.
+    """
+    sys.stdout.flush()
+    protocol_fd = os.dup(sys.stdout.fileno())
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return anyio.wrap_file(io.TextIOWrapper(os.fdopen(protocol_fd, "wb"), encoding="utf-8"))
 
 
 # ========== Standalone helper functions for testing ==========
@@ -455,14 +948,15 @@ def list_all_skills(skills_dir: str) -> List[Dict[str, Any]]:
     skills = []
     
     if skills_path.exists():
-        for item in skills_path.iterdir():
-            if item.is_dir():
-                skill_file = item / "SKILL.md"
-                if skill_file.exists():
-                    skills.append({
-                        "name": item.name,
-                        "path": str(skill_file)
-                    })
+        with os.scandir(skills_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    skill_file = os.path.join(entry.path, "SKILL.md")
+                    if os.path.isfile(skill_file):
+                        skills.append({
+                            "name": entry.name,
+                            "path": skill_file
+                        })
     
     return sorted(skills, key=lambda x: x["name"])
 
@@ -470,8 +964,8 @@ def list_all_skills(skills_dir: str) -> List[Dict[str, Any]]:
 def get_skill(skill_name: str, skills_dir: str) -> str:
     """Get a skill by name (for testing without MCP)."""
     skills_path = Path(skills_dir).expanduser()
-    execution_id = str(uuid.uuid4())[:8]
-    start_time = datetime.now(timezone.utc)
+    execution_id = _new_execution_id()
+    start_ns = time.monotonic_ns()
     
     # Emit start event
     emit_event(
@@ -488,7 +982,8 @@ def get_skill(skill_name: str, skills_dir: str) -> str:
     
     if skill_file.exists():
         content = skill_file.read_text(encoding="utf-8")
-        duration = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+        word_count = len(content.split())
+        duration = (time.monotonic_ns() - start_ns) // 1_000_000
         
         emit_event(
             event_type="SKILL_END",
@@ -496,7 +991,7 @@ def get_skill(skill_name: str, skills_dir: str) -> str:
             execution_id=execution_id,
             status="success",
             duration_ms=duration,
-            tokens={"output_tokens": len(content.split()), "total_tokens": len(content.split())}
+            tokens={"output_tokens": word_count, "total_tokens": word_count}
         )
         
         return content
@@ -538,7 +1033,10 @@ def main():
         }
     )
     
-    asyncio.run(server.run())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(server.run())
+    else:
+        asyncio.run(server.run())
 
 
 if __name__ == "__main__":
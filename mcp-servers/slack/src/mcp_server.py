@@ -17,6 +17,7 @@ Tools:
 - search_messages: Search messages workspace-wide
 - list_users: List workspace users
 - get_user_info: Get detailed user info
+- get_users_info: Get detailed info for several users concurrently
 - add_reaction: Add reaction to a message
 - remove_reaction: Remove reaction from a message
 - get_reactions: Get all reactions on a message
@@ -30,16 +31,93 @@ Tools:
 
 from __future__ import annotations
 
+import http.client
 import json
 import sys
 import os
-from typing import Any, Optional, Dict
+import select
+import ssl
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Dict, Tuple, Union
 from datetime import datetime
-import urllib.request
+from itertools import islice
 import urllib.parse
-import urllib.error
+
+# Optional: orjson decodes large responses (users.list, history) several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 SLACK_API_BASE = "https://slack.com/api"
+SLACK_ARCHIVE_URL = "https://slack.com/archives/"
+_STRIP_DOTS = str.maketrans("", "", ".")
+HTTP_TIMEOUT = 30
+POOL_MAX_IDLE = 8  # Keep-alive connections held open to the Slack API host
+MAX_CONCURRENT_CALLS = POOL_MAX_IDLE  # Fan-out width; every worker can keep its connection
+
+# What _slack_api needs to know per method, in one place:
+#   ttl         seconds to reuse successful responses (slow-changing reads only;
+#               methods without one, including every write, are never cached)
+#   per_minute  calls per minute, from Slack's rate limit tiers (Tier 2 = 20,
+#               Tier 3 = 50, Tier 4 = 100). Staying under them avoids 429s,
+#               whose Retry-After penalties cost far more than pacing.
+#   max_page    ceiling Slack accepts for the page-size parameter (page_param,
+#               "limit" unless stated); larger requests are clamped.
+#   read_only   safe to send twice, so retried once after a transient 5xx;
+#               writes never are, to avoid double posts.
+SLACK_METHODS: Dict[str, Dict[str, Any]] = {
+    "conversations.list": {"ttl": 60, "per_minute": 20, "max_page": 1000, "read_only": True},
+    "users.list": {"ttl": 60, "per_minute": 20, "max_page": 1000, "read_only": True},
+    "search.messages": {"per_minute": 20, "max_page": 100, "page_param": "count", "read_only": True},
+    "conversations.setTopic": {"per_minute": 20},
+    "reactions.remove": {"per_minute": 20},
+    "conversations.history": {"per_minute": 50, "max_page": 100, "read_only": True},
+    "conversations.replies": {"per_minute": 50, "max_page": 100, "read_only": True},
+    "conversations.info": {"ttl": 900, "per_minute": 50, "read_only": True},
+    "conversations.join": {"per_minute": 50},
+    "conversations.open": {"per_minute": 50},
+    "reactions.add": {"per_minute": 50},
+    "reactions.get": {"per_minute": 50, "read_only": True},
+    "users.info": {"ttl": 900, "per_minute": 100, "read_only": True},
+    "conversations.members": {"per_minute": 100, "max_page": 1000, "read_only": True},
+    "auth.test": {"read_only": True},
+    "chat.getPermalink": {"read_only": True},
+}
+CACHE_MAX_ENTRIES = 2048
+RETRY_AFTER_MAX = 30  # Longest Retry-After (seconds) worth waiting out for the one retry
+RETRY_SERVER_ERRORS = {500, 502, 503, 504}
+RETRY_SERVER_ERROR_DELAY = 0.5
+
+_response_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_response_cache_lock = threading.Lock()
+
+# auth_test() results by token
+_auth_identity: Dict[str, Dict[str, Any]] = {}
+
+# Errors meaning the token is no longer usable; drop its cached identity
+TOKEN_ERRORS = {"token_revoked", "token_expired", "invalid_auth", "account_inactive", "not_authed"}
+
+# Batch user lookups resolve against one users.list snapshot first and only
+# call users.info for IDs it doesn't have (e.g. users who joined since).
+USER_DIRECTORY_TTL = 600
+USER_DIRECTORY_MAX_PAGES = 10  # 1000 users per page
+
+_user_directory: Dict[str, Dict[str, Any]] = {}
+_user_directory_expires = 0.0
+_user_directory_lock = threading.Lock()
+
+# Channel arguments may be given as "#name"; names seen in conversations.list
+# results (from the list tools or a lookup) map to IDs for CHANNEL_NAMES_TTL.
+CHANNEL_NAMES_TTL = 600
+CHANNEL_LOOKUP_MAX_PAGES = 10  # 1000 channels per page
+
+_channel_ids: Dict[str, Tuple[str, float]] = {}
+_channel_lookup_lock = threading.Lock()
 
 
 def _get_token() -> str:
@@ -47,13 +125,187 @@ def _get_token() -> str:
     return os.environ.get("SLACK_BOT_TOKEN", "")
 
 
+class _ConnectionPool:
+    """Keep-alive connections to the Slack API host, reused across calls.
+
+    Every urlopen() call paid a fresh TCP + TLS handshake to slack.com; this
+    keeps up to POOL_MAX_IDLE connections open and hands them out per request.
+    """
+
+    def __init__(self, base_url: str, max_idle: int = POOL_MAX_IDLE):
+        parts = urllib.parse.urlsplit(base_url)
+        self.host = parts.netloc
+        self.path = parts.path.rstrip("/")
+        self.max_idle = max_idle
+        if parts.scheme == "https":
+            # One context for every connection: HTTPSConnection otherwise builds
+            # a fresh one (re-reading the CA bundle) per connection it opens.
+            self._conn_kwargs = {"context": ssl.create_default_context()}
+            self._conn_class = http.client.HTTPSConnection
+        else:
+            self._conn_kwargs = {}
+            self._conn_class = http.client.HTTPConnection
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if not self._dropped(conn):
+                    return conn, True
+                conn.close()
+        return self._conn_class(self.host, timeout=HTTP_TIMEOUT, **self._conn_kwargs), False
+
+    @staticmethod
+    def _dropped(conn: http.client.HTTPConnection) -> bool:
+        """True if the server has closed an idle connection (it reads as EOF)."""
+        if conn.sock is None:
+            return False
+        try:
+            return bool(select.select([conn.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, http_method: str, api_method: str, body: Optional[bytes],
+                headers: Dict[str, str], read_only: bool = False) -> Tuple[int, str, http.client.HTTPMessage, bytes]:
+        """Send one request; returns (status, reason, response headers, body).
+
+        If a reused keep-alive connection turns out to be closed, the request
+        is sent again on another one; but once it was written, only when
+        read_only, as the server may already have acted on a write.
+        """
+        url = f"{self.path}/{api_method}"
+        while True:
+            conn, reused = self._acquire()
+            sent = False
+            try:
+                conn.request(http_method, url, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                conn.close()
+                if reused and (read_only or not sent):
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return response.status, response.reason, response.msg, data
+
+
+_pool = _ConnectionPool(SLACK_API_BASE)
+
+
+class _RateLimiter:
+    """Paces calls per method to a sliding one-minute window, blocking the caller."""
+
+    def __init__(self, limits: Dict[str, int]):
+        self.limits = limits
+        self._calls: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, method: str) -> None:
+        limit = self.limits.get(method)
+        if not limit:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                calls = self._calls.setdefault(method, deque())
+                while calls and calls[0] <= now - 60:
+                    calls.popleft()
+                if len(calls) < limit:
+                    calls.append(now)
+                    return
+                wait = calls[0] + 60 - now
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter({
+    method: meta["per_minute"] for method, meta in SLACK_METHODS.items() if "per_minute" in meta
+})
+
+
+def _cache_key(method: str, params: Optional[Dict[str, Any]]) -> str:
+    return f"{method}?{json.dumps(params, sort_keys=True)}"
+
+
+def _cache_invalidate(method: str, params: Optional[Dict[str, Any]] = None) -> None:
+    """Drop cached responses for method: the one for params, or all of them if None."""
+    with _response_cache_lock:
+        if params is not None:
+            _response_cache.pop(_cache_key(method, params), None)
+            return
+        prefix = f"{method}?"
+        for key in [k for k in _response_cache if k.startswith(prefix)]:
+            del _response_cache[key]
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _cache_put(key: str, ttl: float, result: Dict[str, Any]) -> None:
+    with _response_cache_lock:
+        if len(_response_cache) >= CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del _response_cache[next(iter(_response_cache))]
+        _response_cache[key] = (time.monotonic() + ttl, result)
+
+
 def _slack_api(method: str, params: Optional[Dict[str, Any]] = None, post_json: bool = False) -> Dict[str, Any]:
     """Make a Slack API request."""
     token = _get_token()
     if not token:
         return {"ok": False, "error": "SLACK_BOT_TOKEN not configured"}
 
-    url = f"{SLACK_API_BASE}/{method}"
+    meta = SLACK_METHODS.get(method, {})
+    max_page = meta.get("max_page")
+    if max_page and params:
+        page_param = meta.get("page_param", "limit")
+        if params.get(page_param, 0) > max_page:
+            params = dict(params, **{page_param: max_page})
+
+    ttl = meta.get("ttl")
+    if ttl:
+        cache_key = _cache_key(method, params)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    result = _slack_api_uncached(method, token, params, post_json, read_only=meta.get("read_only", False))
+    if result.get("error") in TOKEN_ERRORS:
+        _auth_identity.pop(token, None)
+    if ttl and result.get("ok"):
+        _cache_put(cache_key, ttl, result)
+    return result
+
+
+def _slack_api_uncached(method: str, token: str, params: Optional[Dict[str, Any]], post_json: bool,
+                        read_only: bool = False) -> Dict[str, Any]:
+    """Send a Slack API request over a pooled connection.
+
+    A 429 is retried once after its Retry-After; a transient 5xx is retried
+    once after a short pause if the method is read_only.
+    """
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json; charset=utf-8" if post_json else "application/x-www-form-urlencoded"
@@ -68,19 +320,277 @@ def _slack_api(method: str, params: Optional[Dict[str, Any]] = None, post_json:
         else:
             data = None
 
-        req = urllib.request.Request(url, data=data, headers=headers, method="POST" if data else "GET")
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            return json.loads(response.read().decode('utf-8'))
+        _rate_limiter.acquire(method)
+        status, reason, response_headers, body = _pool.request("POST" if data else "GET", method, data, headers, read_only)
 
-    except urllib.error.HTTPError as e:
-        return {"ok": False, "error": f"HTTP {e.code}: {e.reason}"}
-    except urllib.error.URLError as e:
-        return {"ok": False, "error": f"Network error: {e.reason}"}
+        if status == 429:
+            try:
+                retry_after = int(response_headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1
+            if retry_after <= RETRY_AFTER_MAX:
+                time.sleep(retry_after)
+                status, reason, response_headers, body = _pool.request("POST" if data else "GET", method, data, headers, read_only)
+        elif status in RETRY_SERVER_ERRORS and read_only:
+            time.sleep(RETRY_SERVER_ERROR_DELAY)
+            status, reason, response_headers, body = _pool.request("POST" if data else "GET", method, data, headers, read_only)
+
+        if status >= 400:
+            return {"ok": False, "error": f"HTTP {status}: {reason}"}
+        # Decoded whole on purpose: pages are capped (users.list 1000, history
+        # 100 items) and the body must be read to the end anyway before the
+        # keep-alive connection can be reused, so streaming buys nothing.
+        # Both accept the raw UTF-8 bytes; no intermediate str
+        return orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+
+    except (OSError, http.client.HTTPException) as e:
+        return {"ok": False, "error": f"Network error: {e}"}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
 
+def _slack_api_many(calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """Make independent Slack API reads concurrently; results are in call order.
+
+    N calls take roughly one round-trip instead of N, each on its own pooled
+    keep-alive connection.
+    """
+    if len(calls) <= 1:
+        return [_slack_api(method, params) for method, params in calls]
+
+    with ThreadPoolExecutor(max_workers=min(len(calls), MAX_CONCURRENT_CALLS)) as pool:
+        return list(pool.map(lambda call: _slack_api(*call), calls))
+
+
+def _slack_api_pages(method: str, params: Dict[str, Any], items_key: str,
+                     limit: int):
+    """Yield successive pages of a cursor-paginated read method.
+
+    While the caller projects one page, the next is already in flight (as
+    long as fewer than limit items have been seen), so round-trips overlap
+    with processing. Stops after the last page or an error result; callers
+    break out once they have enough.
+    """
+    params = dict(params, limit=limit)  # _slack_api clamps it to the page ceiling
+    seen = 0
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        result = _slack_api(method, params)
+        while True:
+            cursor = result.get("response_metadata", {}).get("next_cursor") if result.get("ok") else None
+            seen += len(result.get(items_key, []))
+            pending = None
+            if cursor:
+                params = dict(params, cursor=cursor)
+                if seen < limit:
+                    pending = prefetcher.submit(_slack_api, method, params)
+
+            yield result
+
+            if not cursor:
+                return
+            result = pending.result() if pending else _slack_api(method, params)
+
+
+def _get_user_directory() -> Dict[str, Dict[str, Any]]:
+    """Map of user ID -> user object from users.list, refreshed every USER_DIRECTORY_TTL."""
+    global _user_directory, _user_directory_expires
+
+    with _user_directory_lock:
+        if _user_directory_expires > time.monotonic():
+            return _user_directory
+
+        directory = {}
+        pages = _slack_api_pages("users.list", {}, "members", USER_DIRECTORY_MAX_PAGES * 1000)
+        for page_number, result in enumerate(pages, 1):
+            if not result.get("ok"):
+                break  # Lookups fall back to users.info
+            for user in result.get("members", []):
+                directory[user.get("id")] = user
+            if page_number == USER_DIRECTORY_MAX_PAGES:
+                break
+
+        _user_directory = directory
+        _user_directory_expires = time.monotonic() + USER_DIRECTORY_TTL
+        return directory
+
+
+def _remember_channels(channels: List[Dict[str, Any]]) -> None:
+    """Record name -> ID for channels from a conversations.list page."""
+    expires = time.monotonic() + CHANNEL_NAMES_TTL
+    for channel in channels:
+        name = channel.get("name")
+        if name:
+            _channel_ids[name] = (channel.get("id"), expires)
+
+
+def _cached_channel_id(name: str) -> Optional[str]:
+    entry = _channel_ids.get(name)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+
+def _resolve_channel(channel: str) -> str:
+    """Turn "#name" into a channel ID; anything else is returned as is.
+
+    Names missing from the cache are looked up by walking conversations.list
+    (stopping at the page that has them). An unknown name is passed through
+    so Slack reports channel_not_found.
+    """
+    if not channel.startswith("#"):
+        return channel
+    name = channel[1:]
+
+    channel_id = _cached_channel_id(name)
+    if channel_id:
+        return channel_id
+
+    with _channel_lookup_lock:
+        channel_id = _cached_channel_id(name)  # Another thread may have found it
+        if channel_id:
+            return channel_id
+        pages = _slack_api_pages("conversations.list", {
+            "types": "public_channel,private_channel",
+            "exclude_archived": True
+        }, "channels", CHANNEL_LOOKUP_MAX_PAGES * 1000)
+        for page_number, result in enumerate(pages, 1):
+            if not result.get("ok"):
+                break
+            _remember_channels(result.get("channels", []))
+            channel_id = _cached_channel_id(name)
+            if channel_id or page_number == CHANNEL_LOOKUP_MAX_PAGES:
+                break
+
+    return channel_id or channel
+
+
+def _lookup_users(user_ids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Resolve user IDs to user objects; returns (found, errors by ID).
+
+    Served from the users.list directory where possible; the rest are
+    fetched with concurrent users.info calls.
+    """
+    directory = _get_user_directory()
+    found = {uid: directory[uid] for uid in user_ids if uid in directory}
+    misses = [uid for uid in user_ids if uid not in found]
+
+    errors = {}
+    for uid, result in zip(misses, _slack_api_many([("users.info", {"user": uid}) for uid in misses])):
+        if result.get("ok"):
+            found[uid] = result.get("user", {})
+        else:
+            errors[uid] = result.get("error", "Unknown error")
+    return found, errors
+
+
+def _topic_value(channel: Dict[str, Any], key: str) -> str:
+    """Text of a channel's topic or purpose ({"value": ..., "creator": ..., ...})."""
+    field = channel.get(key)
+    return field.get("value", "") if field else ""
+
+
+def _compile_projector(name: str, fields: List[Tuple[str, str, Any]]):
+    """Generate a function that projects a Slack object to a fixed set of fields.
+
+    fields are (output key, source key, default) with literal defaults; a
+    source key "parent.child" reads from a nested object, treating a
+    missing or null parent as {}. The generated function is one dict display
+    of inlined .get calls, so per-row cost has no loop over the spec.
+    """
+    parents: Dict[str, str] = {}
+    items = []
+    for out_key, src_key, default in fields:
+        if "." in src_key:
+            parent, child = src_key.split(".", 1)
+            var = parents.setdefault(parent, f"_{parent}")
+            items.append(f"        {out_key!r}: {var}.get({child!r}, {default!r}),")
+        else:
+            items.append(f"        {out_key!r}: get({src_key!r}, {default!r}),")
+
+    source = "\n".join([
+        f"def {name}(obj):",
+        "    get = obj.get",
+        *(f"    {var} = get({parent!r}) or {{}}" for parent, var in parents.items()),
+        "    return {",
+        *items,
+        "    }",
+    ])
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<projector {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+# Projected rows are plain dicts on purpose: each page is serialized to JSON
+# as soon as it is built, so slotted records would only add a conversion
+# step (stdlib json can't encode them) without living long enough to save
+# memory.
+_project_channel = _compile_projector("_project_channel", [
+    ("id", "id", None),
+    ("name", "name", None),
+    ("is_private", "is_private", False),
+    ("is_member", "is_member", False),
+    ("is_im", "is_im", False),
+    ("is_mpim", "is_mpim", False),
+    ("topic", "topic.value", ""),
+    ("purpose", "purpose.value", ""),
+    ("num_members", "num_members", 0),
+])
+
+# conversations.info; "created" is still the raw epoch and gets formatted by the caller
+_project_channel_info = _compile_projector("_project_channel_info", [
+    ("id", "id", None),
+    ("name", "name", None),
+    ("is_private", "is_private", False),
+    ("is_archived", "is_archived", False),
+    ("is_member", "is_member", False),
+    ("is_im", "is_im", False),
+    ("is_mpim", "is_mpim", False),
+    ("topic", "topic.value", ""),
+    ("purpose", "purpose.value", ""),
+    ("creator", "creator", None),
+    ("created", "created", ""),
+    ("num_members", "num_members", 0),
+])
+
+_project_user = _compile_projector("_project_user", [
+    ("id", "id", None),
+    ("name", "name", None),
+    ("real_name", "profile.real_name", ""),
+    ("display_name", "profile.display_name", ""),
+    ("email", "profile.email", ""),
+    ("title", "profile.title", ""),
+    ("is_admin", "is_admin", False),
+    ("is_bot", "is_bot", False),
+    ("timezone", "tz", ""),
+])
+
+# Project a users.info user object to the fields this server returns
+_format_user_info = _compile_projector("_format_user_info", [
+    ("id", "id", None),
+    ("name", "name", None),
+    ("real_name", "profile.real_name", ""),
+    ("display_name", "profile.display_name", ""),
+    ("email", "profile.email", ""),
+    ("title", "profile.title", ""),
+    ("phone", "profile.phone", ""),
+    ("status_text", "profile.status_text", ""),
+    ("status_emoji", "profile.status_emoji", ""),
+    ("is_admin", "is_admin", False),
+    ("is_owner", "is_owner", False),
+    ("is_bot", "is_bot", False),
+    ("timezone", "tz", ""),
+    ("timezone_label", "tz_label", ""),
+])
+
+
+def _format_reactions(reactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Project a message's reactions to name/count/users."""
+    return [
+        {"name": r.get("name"), "count": r.get("count"), "users": r.get("users", [])}
+        for r in reactions
+    ]
+
+
 def _format_timestamp(ts: str) -> str:
     """Convert Slack timestamp to readable format."""
     try:
@@ -95,13 +605,22 @@ def _format_timestamp(ts: str) -> str:
 # ============================================================================
 
 def auth_test() -> Dict[str, Any]:
-    """Get information about the current bot/user (who am I)."""
+    """Get information about the current bot/user (who am I).
+
+    The identity behind a token never changes, so a successful answer is
+    kept for as long as the same token is configured.
+    """
+    token = _get_token()
+    cached = _auth_identity.get(token)
+    if cached is not None:
+        return cached
+
     result = _slack_api("auth.test")
 
     if not result.get("ok"):
         return {"success": False, "error": result.get("error", "Unknown error")}
 
-    return {
+    _auth_identity[token] = identity = {
         "success": True,
         "user_id": result.get("user_id"),
         "user": result.get("user"),
@@ -110,6 +629,7 @@ def auth_test() -> Dict[str, Any]:
         "bot_id": result.get("bot_id"),
         "is_enterprise_install": result.get("is_enterprise_install", False)
     }
+    return identity
 
 
 def list_channels(
@@ -117,29 +637,22 @@ def list_channels(
     exclude_archived: bool = True,
     limit: int = 100
 ) -> Dict[str, Any]:
-    """List channels in the workspace."""
-    result = _slack_api("conversations.list", {
-        "types": types,
-        "exclude_archived": exclude_archived,
-        "limit": min(limit, 1000)
-    })
-
-    if not result.get("ok"):
-        return {"success": False, "error": result.get("error", "Unknown error")}
-
+    """List channels in the workspace, following pagination up to limit."""
+    limit = max(limit, 0)
     channels = []
-    for ch in result.get("channels", []):
-        channels.append({
-            "id": ch.get("id"),
-            "name": ch.get("name"),
-            "is_private": ch.get("is_private", False),
-            "is_member": ch.get("is_member", False),
-            "is_im": ch.get("is_im", False),
-            "is_mpim": ch.get("is_mpim", False),
-            "topic": ch.get("topic", {}).get("value", ""),
-            "purpose": ch.get("purpose", {}).get("value", ""),
-            "num_members": ch.get("num_members", 0)
-        })
+    for result in _slack_api_pages("conversations.list", {
+        "types": types,
+        "exclude_archived": exclude_archived
+    }, "channels", limit):
+        if not result.get("ok"):
+            return {"success": False, "error": result.get("error", "Unknown error")}
+
+        page = result.get("channels", [])
+        _remember_channels(page)
+        channels.extend(map(_project_channel, page))
+        if len(channels) >= limit:
+            break
+    del channels[limit:]
 
     return {
         "success": True,
@@ -153,46 +666,56 @@ def list_conversations(
     exclude_archived: bool = True,
     limit: int = 200
 ) -> Dict[str, Any]:
-    """List all conversations including channels, DMs, and group DMs."""
-    result = _slack_api("conversations.list", {
-        "types": types,
-        "exclude_archived": exclude_archived,
-        "limit": min(limit, 1000)
-    })
-
-    if not result.get("ok"):
-        return {"success": False, "error": result.get("error", "Unknown error")}
-
+    """List all conversations including channels, DMs, and group DMs, following pagination up to limit."""
+    limit = max(limit, 0)
     conversations = []
-    for conv in result.get("channels", []):
-        conv_type = "channel"
-        if conv.get("is_im"):
-            conv_type = "dm"
-        elif conv.get("is_mpim"):
-            conv_type = "group_dm"
-        elif conv.get("is_private"):
-            conv_type = "private_channel"
-
-        conversations.append({
-            "id": conv.get("id"),
-            "name": conv.get("name", conv.get("user", "")),
-            "type": conv_type,
-            "is_member": conv.get("is_member", False),
-            "user": conv.get("user"),  # For DMs, the other user's ID
-            "topic": conv.get("topic", {}).get("value", ""),
-            "purpose": conv.get("purpose", {}).get("value", ""),
-            "num_members": conv.get("num_members", 0)
-        })
+    append = conversations.append
+    counts = Counter()
+    for result in _slack_api_pages("conversations.list", {
+        "types": types,
+        "exclude_archived": exclude_archived
+    }, "channels", limit):
+        if not result.get("ok"):
+            return {"success": False, "error": result.get("error", "Unknown error")}
+
+        page = result.get("channels", [])
+        _remember_channels(page)
+        for conv in page:
+            if len(conversations) == limit:
+                break
+            get = conv.get
+            conv_type = "channel"
+            if get("is_im"):
+                conv_type = "dm"
+            elif get("is_mpim"):
+                conv_type = "group_dm"
+            elif get("is_private"):
+                conv_type = "private_channel"
+            counts[conv_type] += 1
+
+            user = get("user")  # For DMs, the other user's ID
+            append({
+                "id": get("id"),
+                "name": get("name", user or ""),
+                "type": conv_type,
+                "is_member": get("is_member", False),
+                "user": user,
+                "topic": _topic_value(conv, "topic"),
+                "purpose": _topic_value(conv, "purpose"),
+                "num_members": get("num_members", 0)
+            })
+        if len(conversations) >= limit:
+            break
 
     return {
         "success": True,
         "conversations": conversations,
         "count": len(conversations),
         "by_type": {
-            "channels": len([c for c in conversations if c["type"] == "channel"]),
-            "private_channels": len([c for c in conversations if c["type"] == "private_channel"]),
-            "dms": len([c for c in conversations if c["type"] == "dm"]),
-            "group_dms": len([c for c in conversations if c["type"] == "group_dm"])
+            "channels": counts["channel"],
+            "private_channels": counts["private_channel"],
+            "dms": counts["dm"],
+            "group_dms": counts["group_dm"]
         }
     }
 
@@ -241,11 +764,13 @@ def send_message(
     if not result.get("ok"):
         return {"success": False, "error": result.get("error", "Unknown error")}
 
+    sent_channel = result.get("channel")
+    ts = result.get("ts")
     return {
         "success": True,
-        "channel": result.get("channel"),
-        "ts": result.get("ts"),
-        "message_url": f"https://slack.com/archives/{result.get('channel')}/p{result.get('ts', '').replace('.', '')}"
+        "channel": sent_channel,
+        "ts": ts,
+        "message_url": f"{SLACK_ARCHIVE_URL}{sent_channel}/p{(ts or '').translate(_STRIP_DOTS)}"
     }
 
 
@@ -254,12 +779,20 @@ def get_channel_history(
     limit: int = 20,
     oldest: Optional[str] = None,
     latest: Optional[str] = None,
-    inclusive: bool = True
+    inclusive: bool = True,
+    resolve_users: bool = False,
+    include_threads: bool = False
 ) -> Dict[str, Any]:
-    """Get message history from a channel, including reactions."""
+    """Get message history from a channel, including reactions.
+
+    With resolve_users, each message also gets a "user_name"; the distinct
+    authors are looked up in one concurrent batch rather than per message.
+    With include_threads, messages that have replies get a "thread" with
+    the get_thread_replies messages, all threads fetched concurrently.
+    """
     params = {
         "channel": channel,
-        "limit": min(limit, 100),
+        "limit": limit,
         "inclusive": inclusive
     }
 
@@ -274,30 +807,46 @@ def get_channel_history(
         return {"success": False, "error": result.get("error", "Unknown error")}
 
     messages = []
+    append = messages.append
     for msg in result.get("messages", []):
-        messages.append({
-            "ts": msg.get("ts"),
-            "time": _format_timestamp(msg.get("ts", "")),
-            "user": msg.get("user"),
-            "text": msg.get("text", ""),
-            "thread_ts": msg.get("thread_ts"),
-            "reply_count": msg.get("reply_count", 0),
-            "reply_users_count": msg.get("reply_users_count", 0),
-            "reactions": [
-                {
-                    "name": r.get("name"),
-                    "count": r.get("count"),
-                    "users": r.get("users", [])
-                }
-                for r in msg.get("reactions", [])
-            ],
-            "has_reactions": len(msg.get("reactions", [])) > 0,
-            "subtype": msg.get("subtype"),
-            "bot_id": msg.get("bot_id"),
-            "attachments": len(msg.get("attachments", [])),
-            "files": len(msg.get("files", []))
+        get = msg.get
+        ts = get("ts")
+        reactions = get("reactions", [])
+        append({
+            "ts": ts,
+            "time": _format_timestamp(ts or ""),
+            "user": get("user"),
+            "text": get("text", ""),
+            "thread_ts": get("thread_ts"),
+            "reply_count": get("reply_count", 0),
+            "reply_users_count": get("reply_users_count", 0),
+            "reactions": _format_reactions(reactions),
+            "has_reactions": bool(reactions),
+            "subtype": get("subtype"),
+            "bot_id": get("bot_id"),
+            "attachments": len(get("attachments", [])),
+            "files": len(get("files", []))
         })
 
+    if resolve_users:
+        found, _ = _lookup_users(list(dict.fromkeys(m["user"] for m in messages if m["user"])))
+        names = {
+            uid: user.get("profile", {}).get("real_name") or user.get("name")
+            for uid, user in found.items()
+        }
+        for m in messages:
+            m["user_name"] = names.get(m["user"])
+
+    parents = [m for m in messages if m["reply_count"]] if include_threads else []
+    if parents:
+        with ThreadPoolExecutor(max_workers=min(len(parents), MAX_CONCURRENT_CALLS)) as pool:
+            threads = list(pool.map(lambda m: get_thread_replies(channel, m["ts"]), parents))
+        for m, thread in zip(parents, threads):
+            if thread["success"]:
+                m["thread"] = thread["messages"]
+            else:
+                m["thread_error"] = thread["error"]
+
     return {
         "success": True,
         "channel": channel,
@@ -318,7 +867,7 @@ def get_thread_replies(
     params = {
         "channel": channel,
         "ts": thread_ts,
-        "limit": min(limit, 100)
+        "limit": limit
     }
 
     if oldest:
@@ -332,21 +881,17 @@ def get_thread_replies(
         return {"success": False, "error": result.get("error", "Unknown error")}
 
     messages = []
+    append = messages.append
     for msg in result.get("messages", []):
-        messages.append({
-            "ts": msg.get("ts"),
-            "time": _format_timestamp(msg.get("ts", "")),
-            "user": msg.get("user"),
-            "text": msg.get("text", ""),
-            "is_parent": msg.get("ts") == thread_ts,
-            "reactions": [
-                {
-                    "name": r.get("name"),
-                    "count": r.get("count"),
-                    "users": r.get("users", [])
-                }
-                for r in msg.get("reactions", [])
-            ]
+        get = msg.get
+        ts = get("ts")
+        append({
+            "ts": ts,
+            "time": _format_timestamp(ts or ""),
+            "user": get("user"),
+            "text": get("text", ""),
+            "is_parent": ts == thread_ts,
+            "reactions": _format_reactions(get("reactions", []))
         })
 
     return {
@@ -370,23 +915,27 @@ def search_messages(
         "query": query,
         "sort": sort,
         "sort_dir": sort_dir,
-        "count": min(count, 100)
+        "count": count
     })
 
     if not result.get("ok"):
         return {"success": False, "error": result.get("error", "Unknown error")}
 
     matches = []
+    append = matches.append
     for match in result.get("messages", {}).get("matches", []):
-        matches.append({
-            "ts": match.get("ts"),
-            "time": _format_timestamp(match.get("ts", "")),
-            "user": match.get("user"),
-            "username": match.get("username"),
-            "text": match.get("text", ""),
-            "channel_id": match.get("channel", {}).get("id"),
-            "channel_name": match.get("channel", {}).get("name"),
-            "permalink": match.get("permalink")
+        get = match.get
+        ts = get("ts")
+        match_channel = get("channel", {})
+        append({
+            "ts": ts,
+            "time": _format_timestamp(ts or ""),
+            "user": get("user"),
+            "username": get("username"),
+            "text": get("text", ""),
+            "channel_id": match_channel.get("id"),
+            "channel_name": match_channel.get("name"),
+            "permalink": get("permalink")
         })
 
     return {
@@ -397,30 +946,29 @@ def search_messages(
     }
 
 
-def list_users(limit: int = 100) -> Dict[str, Any]:
-    """List users in the workspace."""
-    result = _slack_api("users.list", {"limit": min(limit, 200)})
-
-    if not result.get("ok"):
-        return {"success": False, "error": result.get("error", "Unknown error")}
+def list_users(limit: int = 100, include_bots: bool = True) -> Dict[str, Any]:
+    """List users in the workspace, following pagination up to limit.
 
+    Pages are always fetched at the largest size Slack allows and sliced
+    here: deleted users and bots are filtered out, so a page of exactly
+    limit would often come up short, and every call shares one cached
+    page (also used by the user directory). Only as many users as are
+    still needed get projected.
+    """
+    limit = max(limit, 0)
+    page_size = max(limit, SLACK_METHODS["users.list"]["max_page"])
     users = []
-    for user in result.get("members", []):
-        if user.get("deleted"):
-            continue
-
-        profile = user.get("profile", {})
-        users.append({
-            "id": user.get("id"),
-            "name": user.get("name"),
-            "real_name": profile.get("real_name", ""),
-            "display_name": profile.get("display_name", ""),
-            "email": profile.get("email", ""),
-            "title": profile.get("title", ""),
-            "is_admin": user.get("is_admin", False),
-            "is_bot": user.get("is_bot", False),
-            "timezone": user.get("tz", "")
-        })
+    for result in _slack_api_pages("users.list", {}, "members", page_size):
+        if not result.get("ok"):
+            return {"success": False, "error": result.get("error", "Unknown error")}
+
+        selected = (
+            user for user in result.get("members", [])
+            if not user.get("deleted") and (include_bots or not user.get("is_bot"))
+        )
+        users.extend(map(_project_user, islice(selected, limit - len(users))))
+        if len(users) >= limit:
+            break
 
     return {
         "success": True,
@@ -436,27 +984,23 @@ def get_user_info(user_id: str) -> Dict[str, Any]:
     if not result.get("ok"):
         return {"success": False, "error": result.get("error", "Unknown error")}
 
-    user = result.get("user", {})
-    profile = user.get("profile", {})
-
     return {
         "success": True,
-        "user": {
-            "id": user.get("id"),
-            "name": user.get("name"),
-            "real_name": profile.get("real_name", ""),
-            "display_name": profile.get("display_name", ""),
-            "email": profile.get("email", ""),
-            "title": profile.get("title", ""),
-            "phone": profile.get("phone", ""),
-            "status_text": profile.get("status_text", ""),
-            "status_emoji": profile.get("status_emoji", ""),
-            "is_admin": user.get("is_admin", False),
-            "is_owner": user.get("is_owner", False),
-            "is_bot": user.get("is_bot", False),
-            "timezone": user.get("tz", ""),
-            "timezone_label": user.get("tz_label", "")
-        }
+        "user": _format_user_info(result.get("user", {}))
+    }
+
+
+def get_users_info(user_ids: List[str]) -> Dict[str, Any]:
+    """Get detailed information about several users in as few API calls as possible."""
+    user_ids = list(dict.fromkeys(user_ids))  # Dedupe, keep order
+    found, errors = _lookup_users(user_ids)
+    users = [_format_user_info(found[uid]) for uid in user_ids if uid in found]
+
+    return {
+        "success": not errors,
+        "users": users,
+        "count": len(users),
+        "errors": errors
     }
 
 
@@ -522,14 +1066,7 @@ def get_reactions(
         return {"success": False, "error": result.get("error", "Unknown error")}
 
     message = result.get("message", {})
-    reactions = []
-
-    for r in message.get("reactions", []):
-        reactions.append({
-            "name": r.get("name"),
-            "count": r.get("count"),
-            "users": r.get("users", [])
-        })
+    reactions = _format_reactions(message.get("reactions", []))
 
     return {
         "success": True,
@@ -549,24 +1086,12 @@ def get_channel_info(channel: str) -> Dict[str, Any]:
     if not result.get("ok"):
         return {"success": False, "error": result.get("error", "Unknown error")}
 
-    ch = result.get("channel", {})
+    info = _project_channel_info(result.get("channel", {}))
+    info["created"] = _format_timestamp(str(info["created"]))
 
     return {
         "success": True,
-        "channel": {
-            "id": ch.get("id"),
-            "name": ch.get("name"),
-            "is_private": ch.get("is_private", False),
-            "is_archived": ch.get("is_archived", False),
-            "is_member": ch.get("is_member", False),
-            "is_im": ch.get("is_im", False),
-            "is_mpim": ch.get("is_mpim", False),
-            "topic": ch.get("topic", {}).get("value", ""),
-            "purpose": ch.get("purpose", {}).get("value", ""),
-            "creator": ch.get("creator"),
-            "created": _format_timestamp(str(ch.get("created", ""))),
-            "num_members": ch.get("num_members", 0)
-        }
+        "channel": info
     }
 
 
@@ -577,6 +1102,10 @@ def join_channel(channel: str) -> Dict[str, Any]:
     if not result.get("ok"):
         return {"success": False, "error": result.get("error", "Unknown error")}
 
+    # is_member / num_members changed
+    _cache_invalidate("conversations.info", {"channel": channel})
+    _cache_invalidate("conversations.list")
+
     return {
         "success": True,
         "channel": result.get("channel", {}).get("id"),
@@ -594,6 +1123,9 @@ def set_channel_topic(channel: str, topic: str) -> Dict[str, Any]:
     if not result.get("ok"):
         return {"success": False, "error": result.get("error", "Unknown error")}
 
+    _cache_invalidate("conversations.info", {"channel": channel})
+    _cache_invalidate("conversations.list")
+
     return {
         "success": True,
         "channel": channel,
@@ -620,20 +1152,23 @@ def get_permalink(channel: str, message_ts: str) -> Dict[str, Any]:
 
 
 def get_conversation_members(channel: str, limit: int = 100) -> Dict[str, Any]:
-    """Get all members of a channel/conversation."""
-    result = _slack_api("conversations.members", {
-        "channel": channel,
-        "limit": min(limit, 1000)
-    })
-
-    if not result.get("ok"):
-        return {"success": False, "error": result.get("error", "Unknown error")}
+    """Get all members of a channel/conversation, following pagination up to limit."""
+    limit = max(limit, 0)
+    members = []
+    for result in _slack_api_pages("conversations.members", {"channel": channel}, "members", limit):
+        if not result.get("ok"):
+            return {"success": False, "error": result.get("error", "Unknown error")}
+
+        members.extend(result.get("members", []))
+        if len(members) >= limit:
+            break
+    del members[limit:]
 
     return {
         "success": True,
         "channel": channel,
-        "members": result.get("members", []),
-        "count": len(result.get("members", []))
+        "members": members,
+        "count": len(members)
     }
 
 
@@ -668,7 +1203,7 @@ TOOLS = [
                 },
                 "limit": {
                     "type": "integer",
-                    "description": "Maximum channels to return (max 1000)",
+                    "description": "Maximum channels to return (fetched across pages as needed)",
                     "default": 100
                 }
             }
@@ -692,7 +1227,7 @@ TOOLS = [
                 },
                 "limit": {
                     "type": "integer",
-                    "description": "Maximum conversations to return (max 1000)",
+                    "description": "Maximum conversations to return (fetched across pages as needed)",
                     "default": 200
                 }
             }
@@ -752,7 +1287,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID (e.g., C1234567890)"
+                    "description": "Channel ID or #name (e.g., C1234567890 or #general)"
                 },
                 "limit": {
                     "type": "integer",
@@ -766,6 +1301,16 @@ TOOLS = [
                 "latest": {
                     "type": "string",
                     "description": "Only return messages before this timestamp"
+                },
+                "resolve_users": {
+                    "type": "boolean",
+                    "description": "Add each author's name to the messages (looked up concurrently)",
+                    "default": False
+                },
+                "include_threads": {
+                    "type": "boolean",
+                    "description": "Attach thread replies to messages that have them (fetched concurrently)",
+                    "default": False
                 }
             },
             "required": ["channel"]
@@ -779,7 +1324,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID containing the thread"
+                    "description": "Channel ID or #name containing the thread"
                 },
                 "thread_ts": {
                     "type": "string",
@@ -831,8 +1376,13 @@ TOOLS = [
             "properties": {
                 "limit": {
                     "type": "integer",
-                    "description": "Maximum users to return (max 200)",
+                    "description": "Maximum users to return (sliced from pages of up to 1000)",
                     "default": 100
+                },
+                "include_bots": {
+                    "type": "boolean",
+                    "description": "Include bot users",
+                    "default": True
                 }
             }
         }
@@ -851,6 +1401,21 @@ TOOLS = [
             "required": ["user_id"]
         }
     },
+    {
+        "name": "get_users_info",
+        "description": "Get detailed information about several Slack users at once (fetched concurrently).",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "user_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "User IDs (e.g., [\"U1234567890\", \"U0987654321\"])"
+                }
+            },
+            "required": ["user_ids"]
+        }
+    },
     {
         "name": "add_reaction",
         "description": "Add an emoji reaction to a message.",
@@ -859,7 +1424,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID containing the message"
+                    "description": "Channel ID or #name containing the message"
                 },
                 "timestamp": {
                     "type": "string",
@@ -881,7 +1446,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID containing the message"
+                    "description": "Channel ID or #name containing the message"
                 },
                 "timestamp": {
                     "type": "string",
@@ -903,7 +1468,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID containing the message"
+                    "description": "Channel ID or #name containing the message"
                 },
                 "timestamp": {
                     "type": "string",
@@ -926,7 +1491,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID"
+                    "description": "Channel ID or #name"
                 }
             },
             "required": ["channel"]
@@ -940,7 +1505,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID to join"
+                    "description": "Channel ID or #name to join"
                 }
             },
             "required": ["channel"]
@@ -954,7 +1519,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID"
+                    "description": "Channel ID or #name"
                 },
                 "topic": {
                     "type": "string",
@@ -972,7 +1537,7 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID"
+                    "description": "Channel ID or #name"
                 },
                 "message_ts": {
                     "type": "string",
@@ -990,11 +1555,11 @@ TOOLS = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID"
+                    "description": "Channel ID or #name"
                 },
                 "limit": {
                     "type": "integer",
-                    "description": "Maximum members to return (max 1000)",
+                    "description": "Maximum members to return (fetched across pages as needed)",
                     "default": 100
                 }
             },
@@ -1004,86 +1569,148 @@ TOOLS = [
 ]
 
 
-def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Handle incoming MCP request."""
+# tools/list and initialize never change: encode their results once and splice
+# in the request id
+_TOOLS_LIST_RESULT = json.dumps({"tools": TOOLS}, separators=(",", ":")).encode("utf-8")
+_INITIALIZE_RESULT = json.dumps({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {}
+    },
+    "serverInfo": {
+        "name": "slack",
+        "version": "1.2.0"
+    }
+}, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_result(req_id: Any, result_json: bytes) -> bytes:
+    """Build a JSON-RPC response line around an already-encoded result."""
+    return b'{"jsonrpc":"2.0","id":' + json.dumps(req_id).encode("utf-8") + b',"result":' + result_json + b'}\n'
+
+
+def _encode_text_result(req_id: Any, text: str) -> bytes:
+    """Build the tools/call response line for a text result.
+
+    The envelope has a fixed shape, so only the text needs encoding; no
+    nested dicts are built just to be walked by the serializer.
+    """
+    text_json = orjson.dumps(text) if ORJSON_AVAILABLE else json.dumps(text).encode("utf-8")
+    return _encode_result(req_id, b'{"content":[{"type":"text","text":' + text_json + b'}]}')
+
+
+# Tool name -> implementation for tools/call
+TOOL_FUNCTIONS = {
+    "auth_test": auth_test,
+    "list_channels": list_channels,
+    "list_conversations": list_conversations,
+    "open_conversation": open_conversation,
+    "send_message": send_message,
+    "get_channel_history": get_channel_history,
+    "get_thread_replies": get_thread_replies,
+    "search_messages": search_messages,
+    "list_users": list_users,
+    "get_user_info": get_user_info,
+    "get_users_info": get_users_info,
+    "add_reaction": add_reaction,
+    "remove_reaction": remove_reaction,
+    "get_reactions": get_reactions,
+    "get_channel_info": get_channel_info,
+    "join_channel": join_channel,
+    "set_channel_topic": set_channel_topic,
+    "get_permalink": get_permalink,
+    "get_conversation_members": get_conversation_members
+}
+
+
+_JSON_TYPES: Dict[str, Any] = {
+    "string": str,
+    "boolean": bool,
+    "integer": int,
+    "number": (int, float),
+    "array": list,
+    "object": dict,
+}
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Callable[[Any], Optional[str]]:
+    """Build an argument check for one inputSchema.
+
+    The schema is read once here; the returned function only checks required
+    keys and the types of the properties it declares, and gives back an error
+    message or None. Null is accepted for optional properties.
+    """
+    required = tuple(schema.get("required", ()))
+    typed = tuple(
+        (name, _JSON_TYPES[prop["type"]], prop["type"])
+        for name, prop in schema.get("properties", {}).items()
+        if prop.get("type") in _JSON_TYPES
+    )
+
+    def validate(arguments: Any) -> Optional[str]:
+        if not isinstance(arguments, dict):
+            return "arguments must be an object"
+        for name in required:
+            if arguments.get(name) is None:
+                return f"missing required argument '{name}'"
+        for name, expected, type_name in typed:
+            value = arguments.get(name)
+            if value is None:
+                continue
+            # bool is an int subclass, but true is not a valid integer
+            if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+                return f"'{name}' must be of type {type_name}"
+        return None
+
+    return validate
+
+
+# Tool name -> argument validator, compiled from TOOLS
+_VALIDATORS = {tool["name"]: _compile_validator(tool["inputSchema"]) for tool in TOOLS}
+
+
+def handle_request(request: Dict[str, Any]) -> Optional[Union[Dict[str, Any], bytes]]:
+    """Handle incoming MCP request.
+
+    Returns the response message, or for static responses the encoded line;
+    None for notifications, which never get a response.
+    """
+    if "id" not in request:
+        return None  # JSON-RPC notification
+
     method = request.get("method", "")
     req_id = request.get("id")
     params = request.get("params", {})
 
     if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {}
-                },
-                "serverInfo": {
-                    "name": "slack",
-                    "version": "1.2.0"
-                }
-            }
-        }
+        return _encode_result(req_id, _INITIALIZE_RESULT)
 
     elif method == "tools/list":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "tools": TOOLS
-            }
-        }
+        return _encode_result(req_id, _TOOLS_LIST_RESULT)
 
     elif method == "tools/call":
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
 
-        # Map tool names to functions
-        tool_functions = {
-            "auth_test": auth_test,
-            "list_channels": list_channels,
-            "list_conversations": list_conversations,
-            "open_conversation": open_conversation,
-            "send_message": send_message,
-            "get_channel_history": get_channel_history,
-            "get_thread_replies": get_thread_replies,
-            "search_messages": search_messages,
-            "list_users": list_users,
-            "get_user_info": get_user_info,
-            "add_reaction": add_reaction,
-            "remove_reaction": remove_reaction,
-            "get_reactions": get_reactions,
-            "get_channel_info": get_channel_info,
-            "join_channel": join_channel,
-            "set_channel_topic": set_channel_topic,
-            "get_permalink": get_permalink,
-            "get_conversation_members": get_conversation_members
-        }
-
-        if tool_name in tool_functions:
-            try:
-                result = tool_functions[tool_name](**arguments)
-            except TypeError as e:
-                result = {"success": False, "error": f"Invalid arguments: {e}"}
+        tool_function = TOOL_FUNCTIONS.get(tool_name)
+        if tool_function is not None:
+            error = _VALIDATORS[tool_name](arguments)
+            if error is not None:
+                result = {"success": False, "error": f"Invalid arguments: {error}"}
+            else:
+                channel = arguments.get("channel")
+                if channel and channel.startswith("#"):
+                    arguments = dict(arguments, channel=_resolve_channel(channel))
+                try:
+                    result = tool_function(**arguments)
+                except TypeError as e:
+                    result = {"success": False, "error": f"Invalid arguments: {e}"}
+                except Exception as e:
+                    result = {"success": False, "error": str(e)}
         else:
             result = {"success": False, "error": f"Unknown tool: {tool_name}"}
 
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(result, indent=2)
-                    }
-                ]
-            }
-        }
-
-    elif method == "notifications/initialized":
-        return None  # No response needed for notifications
+        return _encode_text_result(req_id, _format_result(result))
 
     else:
         return {
@@ -1096,20 +1723,40 @@ def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         }
 
 
+def _format_result(result: Dict[str, Any]) -> str:
+    """Pretty-print a tool result for the MCP text content block."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(result, indent=2)
+
+
+def _write_message(message: Union[Dict[str, Any], bytes]) -> None:
+    """Write one JSON-RPC message (or an already-encoded line) to stdout as UTF-8."""
+    if isinstance(message, bytes):
+        data = message
+    elif ORJSON_AVAILABLE:
+        data = orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
 def main():
     """Main MCP server loop using stdio."""
+    # Read raw bytes: json.loads takes UTF-8 bytes directly, no text-layer decode
+    stdin = sys.stdin.buffer
     while True:
         try:
-            line = sys.stdin.readline()
+            line = stdin.readline()
             if not line:
                 break
 
-            request = json.loads(line)
+            request = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
             response = handle_request(request)
 
             if response:
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
+                _write_message(response)
 
         except json.JSONDecodeError:
             continue
@@ -1122,8 +1769,7 @@ def main():
                     "message": str(e)
                 }
             }
-            sys.stdout.write(json.dumps(error_response) + "\n")
-            sys.stdout.flush()
+            _write_message(error_response)
 
 
 if __name__ == "__main__":
@@ -33,119 +33,403 @@ Tools (30+ commands):
 
 from __future__ import annotations
 
+import base64
 import json
+import re
 import sys
 import os
+import shutil
 import subprocess
-from pathlib import Path
-from typing import Any, Optional, Dict, List
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Dict, List, Tuple, Union
+
+# Optional: orjson encodes large results (schemas, state) several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Default working directory
 DEFAULT_WORKING_DIR = os.getcwd()
 
+# Resolved path of the terraform binary, once found
+_terraform_path: Optional[str] = None
+
+# Environment for every terraform run, built once rather than copied per call.
+# TF_IN_AUTOMATION drops the "run terraform plan next" style hints meant for
+# humans and TF_INPUT=0 makes a missing variable fail instead of waiting on
+# stdin; values already set in the environment win.
+_BASE_ENV = {"TF_IN_AUTOMATION": "1", "TF_INPUT": "0", **os.environ}
+
+# Successful providers_schema / metadata_functions results. Both take seconds
+# and only change when providers are (re)installed or terraform is upgraded,
+# which the cache keys track (lock file / binary mtime).
+RESULT_CACHE_MAX = 8
+_result_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# tools/call requests run on worker threads, so a long plan or apply doesn't
+# hold up other calls. Tools that change a working directory are still run
+# one at a time per directory; the read-only ones below run freely. (console
+# is left out: it takes the state lock, so it would fail during an apply.)
+MAX_CONCURRENT_CALLS = 4
+READ_ONLY_TOOLS = frozenset({
+    "version", "validate", "show", "graph", "output", "providers",
+    "providers_schema", "metadata_functions", "state_list", "state_show",
+    "state_pull", "workspace_list", "workspace_show",
+})
+_dir_locks: Dict[str, threading.Lock] = {}
+_dir_locks_lock = threading.Lock()
+_stdout_lock = threading.Lock()
+
 
 def _get_working_dir(working_dir: Optional[str] = None) -> str:
-    """Get the working directory for Terraform commands."""
+    """Get the working directory for Terraform commands.
+
+    Symlinks are left alone: resolve() would stat every ancestor directory on
+    each call, and terraform doesn't need a canonical path.
+    """
     if working_dir:
-        path = Path(working_dir).expanduser().resolve()
-        if path.exists():
-            return str(path)
+        path = os.path.abspath(os.path.expanduser(working_dir))
+        if os.path.isdir(path):
+            return path
         return working_dir
     return os.environ.get("TERRAFORM_WORKING_DIR", DEFAULT_WORKING_DIR)
 
 
+def _find_terraform() -> Optional[str]:
+    """Locate the terraform binary on PATH (cached once found)."""
+    global _terraform_path
+    if _terraform_path is None:
+        _terraform_path = shutil.which("terraform")
+    return _terraform_path
+
+
+def _stream_process(
+    cmd: List[str],
+    cwd: str,
+    timeout: int,
+    on_line: Callable[[str], None]
+) -> Tuple[int, str, str]:
+    """Run cmd, handing each stdout line to on_line as it arrives.
+
+    Returns (exit code, stdout, stderr). stderr is drained on a helper
+    thread so a chatty command can't fill its pipe and stall; on timeout the
+    process is killed and subprocess.TimeoutExpired raised, as with
+    subprocess.run.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=_BASE_ENV,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    stderr_parts: List[str] = []
+    drain = threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True)
+    drain.start()
+
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.daemon = True
+    timer.start()
+
+    stdout_parts: List[str] = []
+    try:
+        for line in proc.stdout:
+            stdout_parts.append(line)
+            on_line(line)
+        proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        drain.join()
+        proc.stdout.close()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, "".join(stdout_parts), "".join(stderr_parts)
+
+
+def _mtime_key(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_result(key: Tuple[Any, ...], run: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the cached result for key, or run() and cache it if it succeeded."""
+    with _result_cache_lock:
+        result = _result_cache.get(key)
+        if result is not None:
+            _result_cache.move_to_end(key)
+    if result is None:
+        result = run()
+        if not result.get("success"):
+            return result
+        with _result_cache_lock:
+            _result_cache[key] = result
+            if len(_result_cache) > RESULT_CACHE_MAX:
+                _result_cache.popitem(last=False)
+    return dict(result)  # Callers may add keys; keep the cached copy clean
+
+
 def _run_terraform(
     args: List[str],
     working_dir: Optional[str] = None,
     input_text: Optional[str] = None,
-    timeout: int = 300
+    timeout: int = 300,
+    on_line: Optional[Callable[[str], None]] = None
 ) -> Dict[str, Any]:
-    """Run a Terraform command and return the result."""
+    """Run a Terraform command and return the result.
+
+    With on_line, stdout is streamed to it line by line while the command runs.
+    """
     cwd = _get_working_dir(working_dir)
 
-    # Check if terraform is available
-    try:
-        subprocess.run(["terraform", "version"], capture_output=True, timeout=10, check=True)
-    except FileNotFoundError:
+    # Check if terraform is available (a PATH lookup, not a `terraform version` run)
+    terraform = _find_terraform()
+    if terraform is None:
         return {
             "success": False,
             "error": "Terraform CLI not found. Please install Terraform: https://developer.hashicorp.com/terraform/install"
         }
-    except subprocess.TimeoutExpired:
-        return {"success": False, "error": "Terraform version check timed out"}
-    except subprocess.CalledProcessError as e:
-        return {"success": False, "error": f"Terraform error: {e.stderr.decode() if e.stderr else str(e)}"}
 
-    cmd = ["terraform"] + args
+    argv = [terraform] + args  # Resolved path: no PATH search per exec
+    command = "terraform " + " ".join(args)  # As reported back; joined once
 
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            input=input_text,
-            timeout=timeout
-        )
-
-        output = result.stdout
-        error = result.stderr
+        if on_line is None:
+            completed = subprocess.run(
+                argv,
+                cwd=cwd,
+                env=_BASE_ENV,
+                # stdin is the MCP pipe; never let terraform (or a provider
+                # or backend prompt) read requests off it
+                stdin=subprocess.DEVNULL if input_text is None else None,
+                capture_output=True,
+                text=True,
+                input=input_text,
+                timeout=timeout
+            )
+            returncode, output, error = completed.returncode, completed.stdout, completed.stderr
+        else:
+            returncode, output, error = _stream_process(argv, cwd, timeout, on_line)
 
         # Some terraform commands output to stderr even on success (like init)
-        if result.returncode == 0:
+        if returncode == 0:
             return {
                 "success": True,
                 "output": output or error,
                 "working_dir": cwd,
-                "command": " ".join(cmd)
+                "command": command
             }
         else:
             return {
                 "success": False,
                 "error": error or output,
                 "working_dir": cwd,
-                "command": " ".join(cmd),
-                "exit_code": result.returncode
+                "command": command,
+                "exit_code": returncode
             }
 
     except subprocess.TimeoutExpired:
         return {
             "success": False,
             "error": f"Command timed out after {timeout} seconds",
-            "command": " ".join(cmd)
+            "command": command
         }
     except Exception as e:
         return {
             "success": False,
             "error": str(e),
-            "command": " ".join(cmd)
+            "command": command
         }
 
 
-def _run_terraform_json(
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+
+
+def _decode_documents(text: str) -> List[Any]:
+    """Decode the JSON documents in text, one after another.
+
+    Each raw_decode picks up where the last document ended, so several
+    documents printed back to back need no splitting first. From the first
+    point that isn't a JSON object or array on, the remaining lines are
+    kept as {"raw": line}.
+    """
+    documents: List[Any] = []
+    end = len(text)
+    i = _WHITESPACE.match(text, 0).end()
+    while i < end:
+        try:
+            document, next_i = _JSON_DECODER.raw_decode(text, i)
+        except json.JSONDecodeError:
+            document = None
+        if not isinstance(document, (dict, list)):
+            documents.extend({"raw": line} for line in text[i:].splitlines() if line.strip())
+            break
+        documents.append(document)
+        i = _WHITESPACE.match(text, next_i).end()
+    return documents
+
+
+def _run_terraform_to_file(
     args: List[str],
-    working_dir: Optional[str] = None,
+    working_dir: Optional[str],
+    to_file: str,
     timeout: int = 300
 ) -> Dict[str, Any]:
-    """Run a Terraform command with -json output."""
-    result = _run_terraform(args + ["-json"], working_dir, timeout=timeout)
+    """Run a Terraform command with its stdout written straight to a file.
 
-    if result.get("success") and result.get("output"):
+    For outputs too large to pass back over stdio: the result carries the
+    path and size instead. A relative to_file is taken from the working
+    directory. Existing files are never overwritten: output goes to a temp
+    file beside the target, moved into place only if the command succeeds.
+    """
+    cwd = _get_working_dir(working_dir)
+
+    terraform = _find_terraform()
+    if terraform is None:
+        return {
+            "success": False,
+            "error": "Terraform CLI not found. Please install Terraform: https://developer.hashicorp.com/terraform/install"
+        }
+
+    path = os.path.join(cwd, os.path.expanduser(to_file))
+    command = "terraform " + " ".join(args)
+
+    if os.path.lexists(path):
+        return {
+            "success": False,
+            "error": f"{path} already exists; choose a new file for to_file",
+            "working_dir": cwd,
+            "command": command
+        }
+
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path), prefix=".terraform-output-", delete=False
+        ) as out:
+            temp_path = out.name
+            completed = subprocess.run(
+                [terraform] + args,
+                cwd=cwd,
+                env=_BASE_ENV,
+                stdin=subprocess.DEVNULL,
+                stdout=out,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=timeout
+            )
+    except subprocess.TimeoutExpired:
+        error = f"Command timed out after {timeout} seconds"
+        returncode = None
+    except Exception as e:
+        error = str(e)
+        returncode = None
+    else:
+        error = completed.stderr
+        returncode = completed.returncode
+
+    if returncode == 0:
+        try:
+            if os.path.lexists(path):
+                raise FileExistsError(f"{path} appeared while the command ran")
+            os.replace(temp_path, path)
+        except OSError as e:
+            error = str(e)
+            returncode = None
+        else:
+            return {
+                "success": True,
+                "path": path,
+                "size_bytes": os.path.getsize(path),
+                "working_dir": cwd,
+                "command": command
+            }
+
+    if temp_path is not None:
         try:
-            # Parse JSON output (may be multiple JSON objects, one per line)
-            output = result["output"].strip()
-            if output:
-                lines = output.split("\n")
-                parsed = []
-                for line in lines:
-                    if line.strip():
-                        try:
-                            parsed.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            parsed.append({"raw": line})
-                result["parsed"] = parsed if len(parsed) > 1 else (parsed[0] if parsed else None)
-        except Exception:
+            os.remove(temp_path)
+        except OSError:
             pass
+    result = {"success": False, "error": error, "working_dir": cwd, "command": command}
+    if returncode is not None:
+        result["exit_code"] = returncode
+    return result
+
+
+def _drop_raw_output(result: Dict[str, Any]) -> None:
+    """Replace the raw text of a parsed result with its size.
+
+    The parsed form carries the same data, and large payloads (provider
+    schemas run to megabytes) would otherwise be held and encoded twice.
+    """
+    output = result.pop("output", None)
+    if output is not None:
+        result["output_size_bytes"] = len(output.encode())
+
+
+def _run_terraform_json(
+    args: List[str],
+    working_dir: Optional[str] = None,
+    timeout: int = 300,
+    keep_raw: bool = False
+) -> Dict[str, Any]:
+    """Run a Terraform command with -json output.
+
+    Output is parsed while the command runs. Streaming commands print one
+    JSON object per line; others (validate) print a single indented object
+    across many lines, so consecutive lines that aren't a one-line object
+    are decoded together. Anything that still isn't JSON is kept as {"raw": line}.
+    The raw "output" is dropped once parsed unless keep_raw is set.
+    """
+    parsed: List[Any] = []
+    pending: List[str] = []  # Lines of a multi-line document (or non-JSON text)
+
+    def flush_pending() -> None:
+        if pending:
+            parsed.extend(_decode_documents("".join(pending)))
+            pending.clear()
+
+    def on_line(line: str) -> None:
+        if line.startswith("{"):
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                pass
+            else:
+                flush_pending()
+                parsed.append(obj)
+                return
+        if line.strip() or pending:
+            pending.append(line)
+
+    result = _run_terraform(args + ["-json"], working_dir, timeout=timeout, on_line=on_line)
+    flush_pending()
+
+    if result.get("success") and parsed:
+        result["parsed"] = parsed if len(parsed) > 1 else parsed[0]
+        if not keep_raw:
+            _drop_raw_output(result)
 
     return result
 
@@ -193,8 +477,7 @@ def terraform_init(
     if migrate_state:
         args.append("-migrate-state")
     if backend_config:
-        for key, value in backend_config.items():
-            args.append(f"-backend-config={key}={value}")
+        args.extend(f"-backend-config={key}={value}" for key, value in backend_config.items())
     if plugin_dir:
         args.append(f"-plugin-dir={plugin_dir}")
 
@@ -246,11 +529,9 @@ def terraform_plan(
     if out:
         args.append(f"-out={out}")
     if target:
-        for t in target:
-            args.append(f"-target={t}")
+        args.extend(f"-target={t}" for t in target)
     if var:
-        for key, value in var.items():
-            args.append(f"-var={key}={value}")
+        args.extend(f"-var={key}={value}" for key, value in var.items())
     if var_file:
         args.append(f"-var-file={var_file}")
     if destroy:
@@ -258,8 +539,7 @@ def terraform_plan(
     if refresh_only:
         args.append("-refresh-only")
     if replace:
-        for r in replace:
-            args.append(f"-replace={r}")
+        args.extend(f"-replace={r}" for r in replace)
     if not refresh:
         args.append("-refresh=false")
     if parallelism:
@@ -295,18 +575,15 @@ def terraform_apply(
         args.append(plan_file)
     else:
         if target:
-            for t in target:
-                args.append(f"-target={t}")
+            args.extend(f"-target={t}" for t in target)
         if var:
-            for key, value in var.items():
-                args.append(f"-var={key}={value}")
+            args.extend(f"-var={key}={value}" for key, value in var.items())
         if var_file:
             args.append(f"-var-file={var_file}")
         if refresh_only:
             args.append("-refresh-only")
         if replace:
-            for r in replace:
-                args.append(f"-replace={r}")
+            args.extend(f"-replace={r}" for r in replace)
         if parallelism:
             args.append(f"-parallelism={parallelism}")
 
@@ -332,11 +609,9 @@ def terraform_destroy(
     args = ["destroy", "-input=false", "-auto-approve"]
 
     if target:
-        for t in target:
-            args.append(f"-target={t}")
+        args.extend(f"-target={t}" for t in target)
     if var:
-        for key, value in var.items():
-            args.append(f"-var={key}={value}")
+        args.extend(f"-var={key}={value}" for key, value in var.items())
     if var_file:
         args.append(f"-var-file={var_file}")
     if parallelism:
@@ -352,9 +627,14 @@ def terraform_destroy(
 def terraform_show(
     working_dir: Optional[str] = None,
     plan_file: Optional[str] = None,
-    json_output: bool = True
+    json_output: bool = True,
+    keep_raw: bool = False,
+    to_file: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Show current state or a saved plan file in detail."""
+    """Show current state or a saved plan file in detail.
+
+    With to_file, the output is written there instead of returned.
+    """
     args = ["show"]
 
     if json_output:
@@ -363,6 +643,9 @@ def terraform_show(
     if plan_file:
         args.append(plan_file)
 
+    if to_file:
+        return _run_terraform_to_file(args, working_dir, to_file)
+
     result = _run_terraform(args, working_dir)
 
     if result.get("success") and json_output and result.get("output"):
@@ -370,6 +653,9 @@ def terraform_show(
             result["state"] = json.loads(result["output"])
         except json.JSONDecodeError:
             pass
+        else:
+            if not keep_raw:
+                _drop_raw_output(result)
 
     return result
 
@@ -420,22 +706,55 @@ def terraform_output(
     return result
 
 
+def _decode_console_values(text: str) -> Optional[Any]:
+    """Decode the base64encode(jsonencode([...])) string printed by console."""
+    text = text.strip()
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        return None
+    try:
+        return json.loads(base64.b64decode(text[1:-1], validate=True))
+    except ValueError:
+        return None
+
+
 def terraform_console(
-    expression: str,
+    expression: Optional[str] = None,
     working_dir: Optional[str] = None,
     var: Optional[Dict[str, str]] = None,
-    var_file: Optional[str] = None
+    var_file: Optional[str] = None,
+    expressions: Optional[List[str]] = None
 ) -> Dict[str, Any]:
-    """Evaluate a Terraform expression (non-interactive)."""
+    """Evaluate a Terraform expression (non-interactive).
+
+    Each console run loads the configuration, state and providers, and piped
+    console only prints its last result, so several expressions are evaluated
+    in one run as jsonencode([...]) and returned as "values". The JSON is
+    base64 encoded so console's string quoting never needs undoing.
+    """
+    if not expression and not expressions:
+        return {"success": False, "error": "expression or expressions is required"}
+    if expression and expressions:
+        return {"success": False, "error": "Pass either expression or expressions, not both"}
+
     args = ["console"]
 
     if var:
-        for key, value in var.items():
-            args.append(f"-var={key}={value}")
+        args.extend(f"-var={key}={value}" for key, value in var.items())
     if var_file:
         args.append(f"-var-file={var_file}")
 
-    return _run_terraform(args, working_dir, input_text=expression + "\n")
+    if not expressions:
+        return _run_terraform(args, working_dir, input_text=expression + "\n")
+
+    batch = "base64encode(jsonencode([" + ", ".join(expressions) + "]))"
+    result = _run_terraform(args, working_dir, input_text=batch + "\n")
+
+    if result.get("success") and result.get("output"):
+        values = _decode_console_values(result["output"])
+        if values is not None:
+            result["values"] = values
+
+    return result
 
 
 def terraform_providers(working_dir: Optional[str] = None) -> Dict[str, Any]:
@@ -444,31 +763,64 @@ def terraform_providers(working_dir: Optional[str] = None) -> Dict[str, Any]:
 
 
 def terraform_providers_schema(
-    working_dir: Optional[str] = None
+    working_dir: Optional[str] = None,
+    keep_raw: bool = False,
+    to_file: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Output schemas for all providers (JSON). Very useful for understanding resource attributes."""
-    result = _run_terraform(["providers", "schema", "-json"], working_dir, timeout=120)
+    """Output schemas for all providers (JSON). Very useful for understanding resource attributes.
 
-    if result.get("success") and result.get("output"):
-        try:
-            result["schema"] = json.loads(result["output"])
-        except json.JSONDecodeError:
-            pass
+    Cached per working directory until its .terraform.lock.hcl changes
+    (i.e. until providers are re-initialized). With to_file, the schema is
+    written there instead of returned.
+    """
+    if to_file:
+        return _run_terraform_to_file(["providers", "schema", "-json"], working_dir, to_file, timeout=120)
+
+    def run() -> Dict[str, Any]:
+        result = _run_terraform(["providers", "schema", "-json"], working_dir, timeout=120)
+
+        if result.get("success") and result.get("output"):
+            try:
+                result["schema"] = json.loads(result["output"])
+            except json.JSONDecodeError:
+                pass
+
+        return result
+
+    cwd = _get_working_dir(working_dir)
+    lock_mtime = _mtime_key(os.path.join(cwd, ".terraform.lock.hcl"))
+    if lock_mtime is None:
+        result = run()  # Nothing to key the cache on
+    else:
+        result = _cached_result(("providers_schema", cwd, lock_mtime, _find_terraform()), run)
+
+    if "schema" in result and not keep_raw:
+        _drop_raw_output(result)
 
     return result
 
 
 def terraform_metadata_functions(working_dir: Optional[str] = None) -> Dict[str, Any]:
-    """List available Terraform functions with descriptions."""
-    result = _run_terraform(["metadata", "functions", "-json"], working_dir)
+    """List available Terraform functions with descriptions.
 
-    if result.get("success") and result.get("output"):
-        try:
-            result["functions"] = json.loads(result["output"])
-        except json.JSONDecodeError:
-            pass
+    The function list is built into the terraform binary, so it is cached
+    until the binary changes.
+    """
+    def run() -> Dict[str, Any]:
+        result = _run_terraform(["metadata", "functions", "-json"], working_dir)
 
-    return result
+        if result.get("success") and result.get("output"):
+            try:
+                result["functions"] = json.loads(result["output"])
+            except json.JSONDecodeError:
+                pass
+
+        return result
+
+    terraform = _find_terraform()
+    if terraform is None:
+        return run()  # Reports the missing CLI
+    return _cached_result(("metadata_functions", terraform, _mtime_key(terraform)), run)
 
 
 # ============================================================================
@@ -714,11 +1066,9 @@ def terraform_refresh(
     args = ["refresh", "-input=false"]
 
     if target:
-        for t in target:
-            args.append(f"-target={t}")
+        args.extend(f"-target={t}" for t in target)
     if var:
-        for key, value in var.items():
-            args.append(f"-var={key}={value}")
+        args.extend(f"-var={key}={value}" for key, value in var.items())
     if var_file:
         args.append(f"-var-file={var_file}")
 
@@ -736,8 +1086,7 @@ def terraform_import(
     args = ["import", "-input=false"]
 
     if var:
-        for key, value in var.items():
-            args.append(f"-var={key}={value}")
+        args.extend(f"-var={key}={value}" for key, value in var.items())
     if var_file:
         args.append(f"-var-file={var_file}")
 
@@ -906,7 +1255,9 @@ TOOLS = [
             "properties": {
                 "working_dir": {"type": "string", "description": "Directory containing Terraform files"},
                 "plan_file": {"type": "string", "description": "Path to plan file to show"},
-                "json_output": {"type": "boolean", "description": "Output as JSON", "default": True}
+                "json_output": {"type": "boolean", "description": "Output as JSON", "default": True},
+                "keep_raw": {"type": "boolean", "description": "Also return the raw JSON text", "default": False},
+                "to_file": {"type": "string", "description": "Write the output to this new file (must not exist) and return its path and size instead (for large state)"}
             }
         }
     },
@@ -941,12 +1292,16 @@ TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "expression": {"type": "string", "description": "Expression to evaluate"},
+                "expression": {"type": "string", "description": "Expression to evaluate (not with expressions)"},
+                "expressions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Several expressions to evaluate in one run (not with expression); results are returned as JSON values"
+                },
                 "working_dir": {"type": "string", "description": "Directory containing Terraform files"},
                 "var": {"type": "object", "description": "Variable values"},
                 "var_file": {"type": "string", "description": "Variable file path"}
-            },
-            "required": ["expression"]
+            }
         }
     },
     {
@@ -965,7 +1320,9 @@ TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "working_dir": {"type": "string", "description": "Directory containing Terraform files"}
+                "working_dir": {"type": "string", "description": "Directory containing Terraform files"},
+                "keep_raw": {"type": "boolean", "description": "Also return the raw JSON text", "default": False},
+                "to_file": {"type": "string", "description": "Write the schema to this new file (must not exist) and return its path and size instead"}
             }
         }
     },
@@ -1238,131 +1595,255 @@ TOOLS = [
 ]
 
 
-def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Handle incoming MCP request."""
+# tools/list and initialize never change: encode their results once and splice
+# in the request id
+_TOOLS_LIST_RESULT = json.dumps({"tools": TOOLS}, separators=(",", ":")).encode("utf-8")
+_INITIALIZE_RESULT = json.dumps({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {"tools": {}},
+    "serverInfo": {"name": "terraform", "version": "2.0.0"}
+}, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_result(req_id: Any, result_json: bytes) -> bytes:
+    """Build a JSON-RPC response line around an already-encoded result."""
+    return b'{"jsonrpc":"2.0","id":' + json.dumps(req_id).encode("utf-8") + b',"result":' + result_json + b'}\n'
+
+
+def _encode_text_result(req_id: Any, text: str) -> bytes:
+    """Build the tools/call response line for a text result.
+
+    The envelope has a fixed shape, so only the text needs encoding; no
+    nested dicts are built just to be walked by the serializer.
+    """
+    text_json = orjson.dumps(text) if ORJSON_AVAILABLE else json.dumps(text).encode("utf-8")
+    return _encode_result(req_id, b'{"content":[{"type":"text","text":' + text_json + b'}]}')
+
+
+# Tool name -> implementation for tools/call
+TOOL_FUNCTIONS = {
+    # Core
+    "version": terraform_version,
+    "init": terraform_init,
+    "validate": terraform_validate,
+    "fmt": terraform_fmt,
+    "plan": terraform_plan,
+    "apply": terraform_apply,
+    "destroy": terraform_destroy,
+    # Inspection
+    "show": terraform_show,
+    "graph": terraform_graph,
+    "output": terraform_output,
+    "console": terraform_console,
+    "providers": terraform_providers,
+    "providers_schema": terraform_providers_schema,
+    "metadata_functions": terraform_metadata_functions,
+    # State
+    "state_list": terraform_state_list,
+    "state_show": terraform_state_show,
+    "state_mv": terraform_state_mv,
+    "state_rm": terraform_state_rm,
+    "state_pull": terraform_state_pull,
+    "state_push": terraform_state_push,
+    "state_replace_provider": terraform_state_replace_provider,
+    "force_unlock": terraform_force_unlock,
+    # Workspace
+    "workspace_list": terraform_workspace_list,
+    "workspace_show": terraform_workspace_show,
+    "workspace_select": terraform_workspace_select,
+    "workspace_new": terraform_workspace_new,
+    "workspace_delete": terraform_workspace_delete,
+    # Resource Control
+    "taint": terraform_taint,
+    "untaint": terraform_untaint,
+    "refresh": terraform_refresh,
+    "import": terraform_import,
+    # Module Management
+    "get": terraform_get,
+    "providers_lock": terraform_providers_lock,
+    "providers_mirror": terraform_providers_mirror
+}
+
+
+_JSON_TYPES: Dict[str, Any] = {
+    "string": str,
+    "boolean": bool,
+    "integer": int,
+    "number": (int, float),
+    "array": list,
+    "object": dict,
+}
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Callable[[Any], Optional[str]]:
+    """Build an argument check for one inputSchema.
+
+    The schema is read once here; the returned function only checks required
+    keys and the types of the properties it declares, and gives back an error
+    message or None. Null is accepted for optional properties.
+    """
+    required = tuple(schema.get("required", ()))
+    typed = tuple(
+        (name, _JSON_TYPES[prop["type"]], prop["type"])
+        for name, prop in schema.get("properties", {}).items()
+        if prop.get("type") in _JSON_TYPES
+    )
+
+    def validate(arguments: Any) -> Optional[str]:
+        if not isinstance(arguments, dict):
+            return "arguments must be an object"
+        for name in required:
+            if arguments.get(name) is None:
+                return f"missing required argument '{name}'"
+        for name, expected, type_name in typed:
+            value = arguments.get(name)
+            if value is None:
+                continue
+            # bool is an int subclass, but true is not a valid integer
+            if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+                return f"'{name}' must be of type {type_name}"
+        return None
+
+    return validate
+
+
+# Tool name -> argument validator, compiled from TOOLS
+_VALIDATORS = {tool["name"]: _compile_validator(tool["inputSchema"]) for tool in TOOLS}
+
+
+def handle_request(request: Dict[str, Any]) -> Optional[Union[Dict[str, Any], bytes]]:
+    """Handle incoming MCP request.
+
+    Returns the response message, or for static responses the encoded line;
+    None for notifications, which never get a response.
+    """
+    if "id" not in request:
+        return None  # JSON-RPC notification
+
     method = request.get("method", "")
     req_id = request.get("id")
     params = request.get("params", {})
 
     if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {}},
-                "serverInfo": {"name": "terraform", "version": "2.0.0"}
-            }
-        }
+        return _encode_result(req_id, _INITIALIZE_RESULT)
 
     elif method == "tools/list":
-        return {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "result": {"tools": TOOLS}
-        }
+        return _encode_result(req_id, _TOOLS_LIST_RESULT)
 
     elif method == "tools/call":
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
 
-        tool_functions = {
-            # Core
-            "version": terraform_version,
-            "init": terraform_init,
-            "validate": terraform_validate,
-            "fmt": terraform_fmt,
-            "plan": terraform_plan,
-            "apply": terraform_apply,
-            "destroy": terraform_destroy,
-            # Inspection
-            "show": terraform_show,
-            "graph": terraform_graph,
-            "output": terraform_output,
-            "console": terraform_console,
-            "providers": terraform_providers,
-            "providers_schema": terraform_providers_schema,
-            "metadata_functions": terraform_metadata_functions,
-            # State
-            "state_list": terraform_state_list,
-            "state_show": terraform_state_show,
-            "state_mv": terraform_state_mv,
-            "state_rm": terraform_state_rm,
-            "state_pull": terraform_state_pull,
-            "state_push": terraform_state_push,
-            "state_replace_provider": terraform_state_replace_provider,
-            "force_unlock": terraform_force_unlock,
-            # Workspace
-            "workspace_list": terraform_workspace_list,
-            "workspace_show": terraform_workspace_show,
-            "workspace_select": terraform_workspace_select,
-            "workspace_new": terraform_workspace_new,
-            "workspace_delete": terraform_workspace_delete,
-            # Resource Control
-            "taint": terraform_taint,
-            "untaint": terraform_untaint,
-            "refresh": terraform_refresh,
-            "import": terraform_import,
-            # Module Management
-            "get": terraform_get,
-            "providers_lock": terraform_providers_lock,
-            "providers_mirror": terraform_providers_mirror
-        }
-
-        if tool_name in tool_functions:
-            try:
-                result = tool_functions[tool_name](**arguments)
-            except TypeError as e:
-                result = {"success": False, "error": f"Invalid arguments: {e}"}
-            except Exception as e:
-                result = {"success": False, "error": str(e)}
+        tool_function = TOOL_FUNCTIONS.get(tool_name)
+        if tool_function is not None:
+            error = _VALIDATORS[tool_name](arguments)
+            if error is not None:
+                result = {"success": False, "error": f"Invalid arguments: {error}"}
+            else:
+                try:
+                    result = tool_function(**arguments)
+                except TypeError as e:
+                    result = {"success": False, "error": f"Invalid arguments: {e}"}
+                except Exception as e:
+                    result = {"success": False, "error": str(e)}
         else:
             result = {"success": False, "error": f"Unknown tool: {tool_name}"}
 
+        return _encode_text_result(req_id, _format_result(result))
+
+    else:
         return {
             "jsonrpc": "2.0",
             "id": req_id,
-            "result": {
-                "content": [{"type": "text", "text": json.dumps(result, indent=2)}]
-            }
+            "error": {"code": -32601, "message": f"Method not found: {method}"}
         }
 
-    elif method == "notifications/initialized":
-        return None
 
+def _format_result(result: Dict[str, Any]) -> str:
+    """Encode a tool result for the MCP text content block.
+
+    Compact rather than indented: provider schemas and state can run to
+    megabytes, and indentation alone multiplies that several times over.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result).decode("utf-8")
+    return json.dumps(result, separators=(",", ":"))
+
+
+def _write_message(message: Union[Dict[str, Any], bytes]) -> None:
+    """Write one JSON-RPC message (or an already-encoded line) to stdout as UTF-8."""
+    if isinstance(message, bytes):
+        data = message
+    elif ORJSON_AVAILABLE:
+        data = orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
     else:
-        return {
+        data = (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+    with _stdout_lock:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+
+def _dir_lock(working_dir: Optional[str]) -> threading.Lock:
+    """Get the lock serializing directory-changing tools in working_dir."""
+    cwd = _get_working_dir(working_dir)
+    with _dir_locks_lock:
+        lock = _dir_locks.get(cwd)
+        if lock is None:
+            lock = _dir_locks[cwd] = threading.Lock()
+        return lock
+
+
+def _handle_and_write(request: Dict[str, Any]) -> None:
+    """Handle a request and write its response (runs on a worker thread)."""
+    try:
+        params = request.get("params", {})
+        arguments = params.get("arguments", {})
+        if params.get("name") in READ_ONLY_TOOLS or not isinstance(arguments, dict):
+            response = handle_request(request)
+        else:
+            with _dir_lock(arguments.get("working_dir")):
+                response = handle_request(request)
+        if response:
+            _write_message(response)
+    except Exception as e:
+        _write_message({
             "jsonrpc": "2.0",
-            "id": req_id,
-            "error": {"code": -32601, "message": f"Method not found: {method}"}
-        }
+            "id": request.get("id"),
+            "error": {"code": -32603, "message": str(e)}
+        })
 
 
 def main():
     """Main MCP server loop using stdio."""
-    while True:
-        try:
-            line = sys.stdin.readline()
-            if not line:
-                break
+    # Read raw bytes: json.loads takes UTF-8 bytes directly, no text-layer decode
+    stdin = sys.stdin.buffer
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS) as pool:
+        while True:
+            try:
+                line = stdin.readline()
+                if not line:
+                    break
 
-            request = json.loads(line)
-            response = handle_request(request)
+                request = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
 
-            if response:
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
+                if request.get("method") == "tools/call":
+                    pool.submit(_handle_and_write, request)
+                    continue
 
-        except json.JSONDecodeError:
-            continue
-        except Exception as e:
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {"code": -32603, "message": str(e)}
-            }
-            sys.stdout.write(json.dumps(error_response) + "\n")
-            sys.stdout.flush()
+                response = handle_request(request)
+
+                if response:
+                    _write_message(response)
+
+            except json.JSONDecodeError:
+                continue
+            except Exception as e:
+                error_response = {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32603, "message": str(e)}
+                }
+                _write_message(error_response)
 
 
 if __name__ == "__main__":